@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark del escaneo de docs/hardware sobre un árbol sintético.
+
+Compara el recorrido anterior (os.walk + stat por archivo + reconstrucción
+de la ruta en el diccionario) con scan_copied_files: en frío hasheando
+todo, en frío con los hashes del manifiesto de la sincronización y en
+caliente con la caché de metadatos.
+
+Uso: python3 .github/scripts/bench_scan.py [archivos] [carpetas_por_nivel]
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import copy_hardware_docs as docs
+
+def png_bytes(width, height, payload):
+    """PNG mínimo: firma, IHDR y relleno para dar tamaño al archivo"""
+    ihdr = struct.pack('>II', width, height) + b'\x08\x06\x00\x00\x00'
+    return (b'\x89PNG\r\n\x1a\n' + struct.pack('>I', 13) + b'IHDR' + ihdr +
+            b'\x00\x00\x00\x00' + bytes(payload))
+
+def pdf_bytes(pages, payload):
+    return (b'%%PDF-1.4\n1 0 obj << /Type /Pages /Count %d /Kids [] >> endobj\n' % pages +
+            bytes(payload) + b'\n%EOF\n')
+
+def make_tree(root, files, fanout):
+    """Crear `files` archivos repartidos en carpetas de tres niveles"""
+    folders = [Path(root, f"a{i}", f"b{j}", f"c{k}")
+               for i in range(fanout) for j in range(fanout) for k in range(fanout)]
+    for folder in folders:
+        folder.mkdir(parents=True)
+    for n in range(files):
+        folder = folders[n % len(folders)]
+        kind = n % 3
+        if kind == 0:
+            (folder / f"img_{n}.png").write_bytes(png_bytes(640, 480, 4096))
+        elif kind == 1:
+            (folder / f"doc_{n}.pdf").write_bytes(pdf_bytes(n % 20 + 1, 8192))
+        else:
+            (folder / f"data_{n}.csv").write_bytes(b'x' * 1024)
+
+def legacy_scan(hardware_dir, docs_dir):
+    """Recorrido anterior a os.scandir (sin hash ni metadatos)"""
+    file_structure = {'files': [], 'folders': {}}
+    for root, dirs, files in os.walk(hardware_dir):
+        root_path = Path(root)
+        relative_path = root_path.relative_to(hardware_dir)
+        target_dict = file_structure
+        if str(relative_path) != '.':
+            for part in relative_path.parts:
+                target_dict = target_dict['folders'].setdefault(part, {'files': [], 'folders': {}})
+        for file in files:
+            file_path = root_path / file
+            file_info = docs.get_file_info(file, file_path.stat())
+            file_info['path'] = str(file_path.relative_to(docs_dir))
+            target_dict['files'].append(file_info)
+    return file_structure
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:34s} {elapsed * 1000:9.1f} ms")
+    return elapsed
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    fanout = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docs_dir = Path(tmp, "docs")
+        hardware_dir = docs_dir / "hardware"
+        cache_file = Path(tmp, "scan_cache.json")
+        make_tree(hardware_dir, files, fanout)
+        print(f"Árbol sintético: {files} archivos en {fanout ** 3} carpetas\n")
+
+        # Lo que deja la sincronización en el manifiesto (tamaño y hash)
+        known_files = {}
+        for path in hardware_dir.rglob('*'):
+            if path.is_file():
+                known_files[path.relative_to(hardware_dir).as_posix()] = {
+                    'size': path.stat().st_size, 'sha256': docs.file_hash(path)}
+        
+        timed("os.walk + stat (anterior)", lambda: legacy_scan(hardware_dir, docs_dir))
+        timed("scandir, sin caché",
+              lambda: docs.scan_copied_files(hardware_dir, docs_dir, cache_file=None))
+        timed("scandir, hashes del manifiesto",
+              lambda: docs.scan_copied_files(hardware_dir, docs_dir, cache_file=None,
+                                             known_files=known_files))
+        # Llenar la caché de metadatos (sin medir)
+        docs.scan_copied_files(hardware_dir, docs_dir, cache_file=cache_file,
+                               known_files=known_files)
+        timed("scandir, caché caliente",
+              lambda: docs.scan_copied_files(hardware_dir, docs_dir, cache_file=cache_file))
+
+if __name__ == "__main__":
+    main()
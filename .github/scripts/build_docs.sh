@@ -2,11 +2,31 @@
 
 # Script para ejecutar el proceso de copia de documentación de hardware
 # Ubicación: .github/scripts/build_docs.sh
-# Uso: .github/scripts/build_docs.sh
+# Uso: .github/scripts/build_docs.sh [--offline] [--temp-venv] [--force] [--link]
+#
+#   --offline    instalar sólo desde la caché local de wheels (sin red)
+#   --temp-venv  entorno virtual temporal desde cero (comportamiento anterior)
+#   --force      regenerar index.html aunque no haya cambios
+#   --link       usar hardlinks en lugar de copias cuando sea posible
+#
+# Por defecto el entorno virtual es persistente en .github/scripts/.cache y
+# se identifica con el hash de requirements-docs.txt y la versión de Python:
+# si no cambió ninguno de los dos, la preparación del entorno se omite.
+# Los wheels descargados quedan en .github/scripts/.cache/wheels para poder
+# reconstruir el entorno sin red (también con DOCS_OFFLINE=1).
 
 set -e  # Salir si hay algún error
 
+now() {
+    python3 -c 'import time; print(time.time())'
+}
+
+elapsed() {
+    python3 -c "print(f'{$2 - $1:.2f}')"
+}
+
 echo " Iniciando construcción de documentación..."
+START_TIME=$(now)
 
 # Obtener la ruta del directorio del proyecto (3 niveles arriba desde .github/scripts)
 PROJECT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
@@ -14,36 +34,91 @@ cd "$PROJECT_DIR"
 
 echo " Directorio del proyecto: $PROJECT_DIR"
 
+# Separar las opciones de este script de las del script de Python
+OFFLINE="${DOCS_OFFLINE:-0}"
+TEMP_MODE=0
+PY_ARGS=()
+for arg in "$@"; do
+    case "$arg" in
+        --offline) OFFLINE=1 ;;
+        --temp-venv) TEMP_MODE=1 ;;
+        *) PY_ARGS+=("$arg") ;;
+    esac
+done
+
 # Verificar que Python está disponible
 if ! command -v python3 &> /dev/null; then
     echo " Python3 no está instalado"
     exit 1
 fi
 
-# Crear directorio temporal para el entorno virtual
-TEMP_VENV=$(mktemp -d)
-echo " Creando entorno virtual temporal en: $TEMP_VENV"
+SCRIPTS_DIR=".github/scripts"
+LOCK_FILE="$SCRIPTS_DIR/requirements-docs.txt"
+CACHE_DIR="$SCRIPTS_DIR/.cache"
+WHEEL_DIR="$CACHE_DIR/wheels"
 
-# Crear entorno virtual
-python3 -m venv "$TEMP_VENV"
+# Instalar las dependencias fijadas en el entorno activo, desde la caché de
+# wheels; con red se completa la caché primero
+install_requirements() {
+    mkdir -p "$WHEEL_DIR"
+    if [ "$OFFLINE" != "1" ]; then
+        if ! pip download --quiet --disable-pip-version-check -r "$LOCK_FILE" -d "$WHEEL_DIR"; then
+            echo "  Sin acceso al índice de paquetes, se usa la caché local de wheels"
+        fi
+    fi
+    pip install --quiet --disable-pip-version-check --no-index \
+        --find-links "$WHEEL_DIR" -r "$LOCK_FILE"
+}
+
+SETUP_START=$(now)
+if [ "$TEMP_MODE" = "1" ]; then
+    # Crear directorio temporal para el entorno virtual
+    VENV_DIR=$(mktemp -d)
+    echo " Creando entorno virtual temporal en: $VENV_DIR"
+    python3 -m venv "$VENV_DIR"
+    source "$VENV_DIR/bin/activate"
+    echo " Instalando dependencias..."
+    install_requirements
+else
+    # Entorno persistente identificado por el lockfile y la versión de Python
+    LOCK_HASH=$( (cat "$LOCK_FILE"; python3 -VV) | sha256sum | cut -c1-16)
+    VENV_DIR="$CACHE_DIR/venv-$LOCK_HASH"
+    STAMP="$VENV_DIR/.lock-hash"
 
-# Activar entorno virtual
-echo " Activando entorno virtual..."
-source "$TEMP_VENV/bin/activate"
+    if [ -f "$STAMP" ] && [ "$(cat "$STAMP")" = "$LOCK_HASH" ]; then
+        echo " Entorno virtual al día ($VENV_DIR), se omite la instalación"
+        source "$VENV_DIR/bin/activate"
+    else
+        echo " Creando entorno virtual persistente en: $VENV_DIR"
+        rm -rf "$VENV_DIR"
+        python3 -m venv "$VENV_DIR"
+        source "$VENV_DIR/bin/activate"
+        echo " Instalando dependencias..."
+        install_requirements
+        echo "$LOCK_HASH" > "$STAMP"
 
-# Instalar dependencias
-echo " Instalando dependencias..."
-pip install --upgrade pip --quiet
-pip install Jinja2 --quiet
+        # Borrar entornos de lockfiles anteriores
+        for old_venv in "$CACHE_DIR"/venv-*; do
+            if [ "$old_venv" != "$VENV_DIR" ]; then
+                rm -rf "$old_venv"
+            fi
+        done
+    fi
+fi
+SETUP_END=$(now)
 
 # Ejecutar script de copia
+# Sincronización incremental; --force regenera index.html, --link usa hardlinks
 echo " Ejecutando script de copia..."
-python3 .github/scripts/copy_hardware_docs.py
+python3 "$SCRIPTS_DIR/copy_hardware_docs.py" "${PY_ARGS[@]}"
+BUILD_END=$(now)
 
-# Limpiar entorno virtual temporal
-echo " Limpiando entorno virtual temporal..."
 deactivate
-rm -rf "$TEMP_VENV"
+if [ "$TEMP_MODE" = "1" ]; then
+    # Limpiar entorno virtual temporal
+    echo " Limpiando entorno virtual temporal..."
+    rm -rf "$VENV_DIR"
+fi
 
 # Verificar que los archivos se generaron correctamente
 if [ -f "docs/index.html" ]; then
@@ -51,17 +126,23 @@ if [ -f "docs/index.html" ]; then
     echo " Archivos generados:"
     echo "   - docs/index.html (página principal)"
     echo "   - docs/hardware/ (archivos copiados)"
-    
+
     # Mostrar estadísticas
     if [ -d "docs/hardware" ]; then
         file_count=$(find docs/hardware -type f | wc -l)
         echo " Total de archivos copiados: $file_count"
     fi
-    
+
 else
     echo " Error: No se pudo generar la documentación"
     exit 1
 fi
 
+# Desglose de tiempos (copia y página detallados arriba por el script de Python)
+END_TIME=$(now)
+echo " Tiempos: entorno $(elapsed "$SETUP_START" "$SETUP_END") s," \
+     "copia + página $(elapsed "$SETUP_END" "$BUILD_END") s," \
+     "total $(elapsed "$START_TIME" "$END_TIME") s"
+
 echo " ¡Proceso completado!"
-echo " Para ver la documentación, abre docs/index.html en tu navegador"
\ No newline at end of file
+echo " Para ver la documentación, abre docs/index.html en tu navegador"
@@ -7,9 +7,21 @@ para visualizar el contenido.
 import os
 import shutil
 import json
+import sys
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from hardware_metadata import image_size, pdf_page_count
+
+# Pillow es opcional: sin él la página enlaza directamente las imágenes originales
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 
 # Configuración de rutas
 BASE_DIR = Path(__file__).parent.parent.parent
@@ -17,6 +29,36 @@ HARDWARE_DIR = BASE_DIR / "hardware"
 DOCS_DIR = BASE_DIR / "docs"
 DOCS_HARDWARE_DIR = DOCS_DIR / "hardware"
 
+# Plantilla de la página y caché de su bytecode compilado
+SCRIPTS_DIR = Path(__file__).parent
+TEMPLATES_DIR = SCRIPTS_DIR / "templates"
+INDEX_TEMPLATE = "index.html.j2"
+CACHE_DIR = SCRIPTS_DIR / ".cache"
+TEMPLATE_CACHE_DIR = CACHE_DIR / "jinja"
+
+# Manifiesto de la última sincronización: fuera de docs/ (que se publica y
+# se commitea) porque guarda mtimes y tiempos que cambian en cada ejecución
+MANIFEST_FILE = CACHE_DIR / "hardware_manifest.json"
+LEGACY_MANIFEST_FILE = DOCS_DIR / ".hardware_manifest.json"
+MANIFEST_VERSION = 2
+
+# Caché de hash y metadatos del escaneo, por tamaño y mtime
+SCAN_CACHE_FILE = CACHE_DIR / "scan_cache.json"
+SCAN_CACHE_VERSION = 1
+# Por debajo de estos bytes a leer el pool de hilos cuesta más de lo que ahorra
+SCAN_POOL_MIN_BYTES = 32 * 1024 * 1024
+
+# Miniaturas y variantes web de las imágenes, nombradas por hash del original
+PREVIEWS_DIR = DOCS_DIR / "previews"
+THUMB_SIZE = 192
+WEB_SIZE = 1600
+WEB_QUALITY = 82
+# Vectoriales: se muestran tal cual
+VARIANT_SKIP_EXTENSIONS = {'.svg'}
+
+# Velocidad de copia supuesta mientras no haya una medición propia (bytes/s)
+DEFAULT_COPY_RATE = 50 * 1024 * 1024
+
 # Extensiones de archivos por categoría
 IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.webp'}
 DOCUMENT_EXTENSIONS = {'.pdf', '.docx', '.doc', '.txt', '.md'}
@@ -26,16 +68,16 @@ def ensure_directory(path):
     """Crear directorio si no existe"""
     path.mkdir(parents=True, exist_ok=True)
 
-def get_file_info(file_path):
-    """Obtener información del archivo"""
-    stat = file_path.stat()
+def get_file_info(name, stat):
+    """Obtener información del archivo a partir de su nombre y su stat"""
+    extension = os.path.splitext(name)[1].lower()
     return {
-        'name': file_path.name,
+        'name': name,
         'size': stat.st_size,
         'size_human': format_size(stat.st_size),
         'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-        'extension': file_path.suffix.lower(),
-        'type': get_file_type(file_path.suffix.lower())
+        'extension': extension,
+        'type': get_file_type(extension)
     }
 
 def format_size(size_bytes):
@@ -62,405 +104,536 @@ def get_file_type(extension):
     else:
         return 'other'
 
-def copy_hardware_files():
-    """Copiar todos los archivos de hardware a docs/hardware"""
-    print(" Copiando archivos de hardware...")
+def file_hash(path, chunk_size=1024 * 1024):
+    """SHA-256 del contenido de un archivo"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_manifest():
+    """Cargar el manifiesto de la última sincronización (vacío si no existe)"""
+    try:
+        with open(MANIFEST_FILE, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': MANIFEST_VERSION, 'files': {}}
+
+def save_manifest(manifest):
+    """Guardar el manifiesto de forma atómica"""
+    ensure_directory(MANIFEST_FILE.parent)
+    tmp_file = MANIFEST_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_file, MANIFEST_FILE)
+    # Versiones anteriores lo guardaban en docs/
+    if LEGACY_MANIFEST_FILE.exists():
+        LEGACY_MANIFEST_FILE.unlink()
+
+def render_signature():
+    """Entradas de la página ajenas a los archivos de hardware
     
-    # Crear directorio de destino
-    ensure_directory(DOCS_HARDWARE_DIR)
+    Hash de la plantilla y del código que genera la página, y si Pillow está
+    disponible (con o sin miniaturas): si cambia alguno hay que regenerarla.
+    """
+    return {
+        'template': file_hash(TEMPLATES_DIR / INDEX_TEMPLATE),
+        'script': file_hash(Path(__file__)),
+        'metadata': file_hash(SCRIPTS_DIR / "hardware_metadata.py"),
+        'pillow': Image is not None,
+    }
+
+def content_signature(files):
+    """Parte del manifiesto de la que depende la página (ruta, tamaño, hash)"""
+    return sorted((path, entry['size'], entry['sha256']) for path, entry in files.items())
+
+def place_file(source, dest, link):
+    """Copiar (o enlazar con hardlink) source en dest reemplazando lo que haya"""
+    ensure_directory(dest.parent)
+    if dest.exists() or dest.is_symlink():
+        dest.unlink()
+    if link:
+        try:
+            os.link(source, dest)
+            return
+        except OSError:
+            # Otro sistema de archivos o sin soporte: copiar
+            pass
+    shutil.copy2(source, dest)
+
+def copy_hardware_files(link=False):
+    """Sincronizar hardware con docs/hardware de forma incremental
     
-    # Limpiar directorio existente
-    if DOCS_HARDWARE_DIR.exists():
-        shutil.rmtree(DOCS_HARDWARE_DIR)
+    Un archivo se salta si tamaño y mtime coinciden con el manifiesto, o si
+    su hash no cambió (p. ej. mtime nuevo tras un checkout). Sólo se copian
+    (o enlazan con link=True) los archivos nuevos o modificados y se borran
+    de docs/hardware los que ya no existen en hardware.
     
-    # Copiar todo el directorio hardware
-    shutil.copytree(HARDWARE_DIR, DOCS_HARDWARE_DIR)
+    Devuelve un diccionario con el resultado; 'changed' indica si cambió
+    el contenido, la plantilla, el script o la disponibilidad de Pillow y
+    hay que regenerar la página.
+    """
+    print(" Sincronizando archivos de hardware...")
+    start = time.perf_counter()
     
-    print(f" Archivos copiados a {DOCS_HARDWARE_DIR}")
-
-def scan_copied_files():
-    """Escanear archivos copiados y generar estructura de datos"""
-    print("📁 Escaneando archivos copiados...")
+    ensure_directory(DOCS_HARDWARE_DIR)
+    old_manifest = load_manifest()
+    old_files = old_manifest['files']
+    new_files = {}
     
-    file_structure = {'files': [], 'folders': {}}
+    result = {'copied': 0, 'skipped': 0, 'deleted': 0,
+              'copied_bytes': 0, 'skipped_bytes': 0}
+    copy_seconds = 0.0
     
-    for root, dirs, files in os.walk(DOCS_HARDWARE_DIR):
+    for root, dirs, files in os.walk(HARDWARE_DIR):
+        dirs.sort()
         root_path = Path(root)
-        relative_path = root_path.relative_to(DOCS_HARDWARE_DIR)
-        
-        # Determinar el diccionario objetivo
-        if str(relative_path) == '.':
-            # Directorio raíz
-            target_dict = file_structure
-        else:
-            # Navegar/crear la estructura de directorios
-            target_dict = file_structure
-            for part in relative_path.parts:
-                if 'folders' not in target_dict:
-                    target_dict['folders'] = {}
-                if part not in target_dict['folders']:
-                    target_dict['folders'][part] = {'files': [], 'folders': {}}
-                target_dict = target_dict['folders'][part]
-        
-        # Agregar archivos al directorio actual
-        if 'files' not in target_dict:
-            target_dict['files'] = []
+        for name in sorted(files):
+            source = root_path / name
+            relative = source.relative_to(HARDWARE_DIR).as_posix()
+            dest = DOCS_HARDWARE_DIR / relative
+            stat = source.stat()
+            entry = old_files.get(relative)
+            dest_ok = dest.exists()
+            
+            if (entry and dest_ok and entry['size'] == stat.st_size
+                    and entry['mtime_ns'] == stat.st_mtime_ns):
+                new_files[relative] = entry
+                result['skipped'] += 1
+                result['skipped_bytes'] += stat.st_size
+                continue
             
-        for file in files:
-            file_path = root_path / file
-            file_info = get_file_info(file_path)
-            file_info['path'] = str(file_path.relative_to(DOCS_DIR))
-            target_dict['files'].append(file_info)
+            digest = file_hash(source)
+            new_files[relative] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                                   'sha256': digest}
+            if entry:
+                unchanged = dest_ok and entry['sha256'] == digest
+            else:
+                # Sin manifiesto previo: comparar con la copia existente
+                unchanged = (dest_ok and dest.stat().st_size == stat.st_size
+                             and file_hash(dest) == digest)
+            if unchanged:
+                result['skipped'] += 1
+                result['skipped_bytes'] += stat.st_size
+                continue
+            
+            t0 = time.perf_counter()
+            place_file(source, dest, link)
+            copy_seconds += time.perf_counter() - t0
+            result['copied'] += 1
+            result['copied_bytes'] += stat.st_size
     
-    return file_structure
+    # Borrar lo que ya no está en hardware (incluye restos no registrados)
+    for root, dirs, files in os.walk(DOCS_HARDWARE_DIR, topdown=False):
+        root_path = Path(root)
+        for name in files:
+            path = root_path / name
+            if path.relative_to(DOCS_HARDWARE_DIR).as_posix() not in new_files:
+                path.unlink()
+                result['deleted'] += 1
+        if root_path != DOCS_HARDWARE_DIR and not any(root_path.iterdir()):
+            root_path.rmdir()
+    
+    # Tiempo ahorrado estimado con la velocidad de copia medida (sólo con
+    # copias reales y suficientemente grandes para que la medida sirva)
+    copy_rate = old_manifest.get('copy_rate', DEFAULT_COPY_RATE)
+    if not link and result['copied_bytes'] >= 1024 * 1024 and copy_seconds > 0:
+        copy_rate = result['copied_bytes'] / copy_seconds
+    result['saved_seconds'] = result['skipped_bytes'] / copy_rate
+    
+    render = render_signature()
+    result['changed'] = (result['copied'] > 0 or result['deleted'] > 0 or
+                         content_signature(new_files) != content_signature(old_files) or
+                         old_manifest.get('render') != render)
+    result['manifest'] = {
+        'version': MANIFEST_VERSION,
+        'files': new_files,
+        'render': render,
+        'copy_rate': copy_rate,
+        'scan_seconds': old_manifest.get('scan_seconds', 0.0),
+        'page_seconds': old_manifest.get('page_seconds', 0.0),
+    }
+    result['seconds'] = time.perf_counter() - start
+    
+    print(f" Copiados: {result['copied']} ({format_size(result['copied_bytes'])}), "
+          f"sin cambios: {result['skipped']} ({format_size(result['skipped_bytes'])}), "
+          f"eliminados: {result['deleted']}")
+    return result
 
-def generate_html_page(file_structure):
-    """Generar página HTML para visualizar los archivos"""
-    print(" Generando página HTML...")
+def new_stats():
+    """Contadores de la página, llenados durante el escaneo"""
+    return {'total_files': 0, 'images': 0, 'documents': 0, 'total_size_bytes': 0}
+
+def add_to_stats(stats, file_info):
+    stats['total_files'] += 1
+    stats['total_size_bytes'] += file_info['size']
+    if file_info['type'] == 'image':
+        stats['images'] += 1
+    elif file_info['type'] == 'document':
+        stats['documents'] += 1
+
+def file_metadata(path, extension, sha256=None):
+    """Hash SHA-256 y metadatos del archivo (páginas de PDF, tamaño de imagen)
+    
+    Con sha256 ya conocido (del manifiesto de la sincronización) el archivo
+    no se vuelve a hashear: sólo se lee lo necesario para los metadatos.
+    """
+    digest = hashlib.sha256() if sha256 is None else None
+    meta = {}
+    if digest is None and extension != '.pdf' and extension not in IMAGE_EXTENSIONS:
+        meta['sha256'] = sha256
+        return meta
+    with open(path, 'rb') as f:
+        if extension == '.pdf':
+            # El contenido se necesita completo para contar las páginas
+            data = f.read()
+            if digest is not None:
+                digest.update(data)
+            meta['pages'] = pdf_page_count(data)
+        else:
+            if digest is not None:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            if extension in IMAGE_EXTENSIONS:
+                size = image_size(f, extension)
+                if size:
+                    meta['width'], meta['height'] = size
+    meta['sha256'] = sha256 if digest is None else digest.hexdigest()
+    return meta
+
+def load_scan_cache(cache_file):
+    """Metadatos de escaneos anteriores, por ruta relativa"""
+    if cache_file is None:
+        return {}
+    try:
+        with open(cache_file, encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == SCAN_CACHE_VERSION:
+            return cache['files']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+def save_scan_cache(cache_file, files):
+    ensure_directory(cache_file.parent)
+    tmp_file = cache_file.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        # json.dumps usa el codificador en C; json.dump escribe por partes en Python
+        f.write(json.dumps({'version': SCAN_CACHE_VERSION, 'files': files}))
+    os.replace(tmp_file, cache_file)
+
+def scan_copied_files(hardware_dir=DOCS_HARDWARE_DIR, docs_dir=DOCS_DIR,
+                      workers=None, cache_file=SCAN_CACHE_FILE, known_files=None):
+    """Escanear archivos copiados y generar estructura de datos
+    
+    Recorre el árbol una sola vez con os.scandir, usando el stat de cada
+    DirEntry, y arma la estructura anidada y las estadísticas en el mismo
+    recorrido. El hash y los metadatos (páginas de PDF, dimensiones de
+    imágenes) se calculan sólo para los archivos cuyo tamaño o mtime cambió
+    desde el último escaneo; el resto sale de la caché. known_files (las
+    entradas del manifiesto, por ruta relativa) aporta el hash de lo que la
+    sincronización ya hasheó, así que esos archivos no se leen dos veces.
+    El pool de hilos sólo se usa cuando hay bastantes bytes que leer
+    (SCAN_POOL_MIN_BYTES); con archivos pequeños es más lento que un hilo.
+    
+    Devuelve (estructura, estadísticas).
+    """
+    print("📁 Escaneando archivos copiados...")
+    
+    cache = load_scan_cache(cache_file)
+    new_cache = {}
+    stats = new_stats()
+    known_files = known_files or {}
+    pending = []
+    prefix = hardware_dir.relative_to(docs_dir).as_posix()
     
-    html_template = '''
-<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Hardware Documentation </title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.8.1/font/bootstrap-icons.css" rel="stylesheet">
-    <style>
-        body { font-family: Arial, sans-serif; background-color: #ffffff; }
-        .file-icon { margin-right: 8px; }
-        .folder-icon { color: #666666; }
-        .file-item { margin: 2px 0; padding: 6px; border-bottom: 1px solid #e0e0e0; }
-        .file-item:hover { background-color: #f5f5f5; }
-        .file-size { color: #666666; font-size: 0.9em; }
-        .file-date { color: #666666; font-size: 0.85em; }
-        .preview-modal img { max-width: 100%; height: auto; }
-        .tree-item { margin-left: 20px; }
-        .stats-card { background-color: #f8f9fa; color: #333333; border: 1px solid #dee2e6; }
-        .type-badge { font-size: 0.75em; }
-        .pdf-viewer { width: 100%; height: 600px; border: none; }
-        .file-link { text-decoration: none; color: #333333; }
-        .file-link:hover { color: #0066cc; }
-        .navbar { background-color: #ffffff !important; border-bottom: 1px solid #dee2e6; }
-        .navbar-brand { color: #333333 !important; }
-        .navbar-text { color: #666666 !important; }
-        .card { border: 1px solid #dee2e6; box-shadow: none; }
-        .card-header { background-color: #f8f9fa; border-bottom: 1px solid #dee2e6; }
-        .btn { border-radius: 3px; }
-        h1, h2, h3, h4, h5 { color: #333333; }
-    </style>
-</head>
-<body>
-    <nav class="navbar navbar-light bg-light">
-        <div class="container-fluid">
-            <span class="navbar-brand mb-0 h1">
-                Hardware Documentation
-            </span>
-            <span class="navbar-text">
-                Generado: {{ generated_time }}
-            </span>
-        </div>
-    </nav>
-
-    <div class="container-fluid mt-4">
-        <div class="row">
-            <div class="col-12">
-                <div class="card mb-4">
-                    <div class="card-header">
-                        <h5 class="mb-0">Resumen de Archivos</h5>
-                    </div>
-                    <div class="card-body">
-                        <div class="row">
-                            <div class="col-md-3">
-                                <strong>Total de Archivos:</strong> {{ stats.total_files }}
-                            </div>
-                            <div class="col-md-3">
-                                <strong>Imágenes:</strong> {{ stats.images }}
-                            </div>
-                            <div class="col-md-3">
-                                <strong>Documentos:</strong> {{ stats.documents }}
-                            </div>
-                            <div class="col-md-3">
-                                <strong>Tamaño Total:</strong> {{ stats.total_size }}
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <div class="row">
-            <div class="col-12">
-                <div class="card">
-                    <div class="card-header">
-                        <h5 class="card-title mb-0">
-                            Archivos de Hardware
-                        </h5>
-                    </div>
-                    <div class="card-body">
-                        {{ render_tree(file_structure, "") }}
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <!-- Modal para previsualizar imágenes -->
-    <div class="modal fade" id="imageModal" tabindex="-1">
-        <div class="modal-dialog modal-lg">
-            <div class="modal-content">
-                <div class="modal-header">
-                    <h5 class="modal-title" id="imageModalLabel">Vista Previa de Imagen</h5>
-                    <button type="button" class="btn-close" data-bs-dismiss="modal"></button>
-                </div>
-                <div class="modal-body text-center">
-                    <img id="modalImage" src="" alt="Vista previa" class="img-fluid">
-                </div>
-                <div class="modal-footer">
-                    <a id="imageDirectLink" href="" target="_blank" class="btn btn-primary">
-                        <i class="bi bi-box-arrow-up-right"></i> Abrir en nueva pestaña
-                    </a>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <!-- Modal para previsualizar PDFs -->
-    <div class="modal fade" id="pdfModal" tabindex="-1">
-        <div class="modal-dialog modal-xl">
-            <div class="modal-content">
-                <div class="modal-header">
-                    <h5 class="modal-title" id="pdfModalLabel">Vista Previa de PDF</h5>
-                    <button type="button" class="btn-close" data-bs-dismiss="modal"></button>
-                </div>
-                <div class="modal-body p-0">
-                    <iframe id="pdfViewer" class="pdf-viewer" src=""></iframe>
-                </div>
-                <div class="modal-footer">
-                    <a id="pdfDirectLink" href="" target="_blank" class="btn btn-primary">
-                        <i class="bi bi-box-arrow-up-right"></i> Abrir en nueva pestaña
-                    </a>
-                    <a id="pdfDownloadLink" href="" download class="btn btn-secondary">
-                        <i class="bi bi-download"></i> Descargar
-                    </a>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-    <script>
-        // Función para mostrar vista previa de imágenes
-        function previewImage(src, title) {
-            document.getElementById('modalImage').src = src;
-            document.getElementById('imageModalLabel').textContent = title;
-            document.getElementById('imageDirectLink').href = src;
-            new bootstrap.Modal(document.getElementById('imageModal')).show();
-        }
-
-        // Función para mostrar vista previa de PDFs
-        function previewPDF(src, title) {
-            document.getElementById('pdfViewer').src = src;
-            document.getElementById('pdfModalLabel').textContent = title;
-            document.getElementById('pdfDirectLink').href = src;
-            document.getElementById('pdfDownloadLink').href = src;
-            new bootstrap.Modal(document.getElementById('pdfModal')).show();
-        }
-
-        // Función para alternar carpetas
-        function toggleFolder(element) {
-            const content = element.nextElementSibling;
-            const icon = element.querySelector('.folder-toggle');
+    def scan_dir(path, relative):
+        folder = {'files': [], 'folders': {}}
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        for entry in entries:
+            entry_relative = f"{relative}/{entry.name}" if relative else entry.name
+            if entry.is_dir():
+                folder['folders'][entry.name] = scan_dir(entry.path, entry_relative)
+                continue
+            if not entry.is_file():
+                continue
+            
+            stat = entry.stat()
+            file_info = get_file_info(entry.name, stat)
+            file_info['path'] = f"{prefix}/{entry_relative}"
+            folder['files'].append(file_info)
+            add_to_stats(stats, file_info)
             
-            if (content.style.display === 'none') {
-                content.style.display = 'block';
-                icon.classList.remove('bi-chevron-right');
-                icon.classList.add('bi-chevron-down');
-            } else {
-                content.style.display = 'none';
-                icon.classList.remove('bi-chevron-down');
-                icon.classList.add('bi-chevron-right');
-            }
-        }
-
-        // Función para abrir archivo en nueva pestaña
-        function openInNewTab(url) {
-            window.open(url, '_blank');
-        }
-
-        // Manejar clicks con Ctrl para abrir en nueva pestaña
-        document.addEventListener('click', function(e) {
-            if (e.ctrlKey || e.metaKey) {
-                const link = e.target.closest('a[onclick*="previewImage"]');
-                if (link) {
-                    e.preventDefault();
-                    const src = link.getAttribute('onclick').match(/'([^']+)'/)[1];
-                    window.open(src, '_blank');
-                }
-            }
-        });
-    </script>
-</body>
-</html>
-    '''
-    
-    def get_file_icon(file_type, extension):
-        """Obtener icono según el tipo de archivo"""
-        if file_type == 'image':
-            return 'bi-file-earmark-image'
-        elif file_type == 'document':
-            if extension == '.pdf':
-                return 'bi-file-earmark-pdf'
+            cached = cache.get(entry_relative)
+            if (cached and cached['size'] == stat.st_size
+                    and cached['mtime_ns'] == stat.st_mtime_ns):
+                file_info.update(cached['meta'])
+                new_cache[entry_relative] = cached
             else:
-                return 'bi-file-earmark-text'
-        else:
-            return 'bi-file-earmark'
+                known = known_files.get(entry_relative)
+                sha256 = known['sha256'] if known and known['size'] == stat.st_size else None
+                pending.append((file_info, entry.path, entry_relative, stat, sha256))
+        return folder
+    
+    file_structure = scan_dir(hardware_dir, "")
+    
+    def process(job):
+        file_info, path, relative, stat, sha256 = job
+        return job, file_metadata(path, file_info['extension'], sha256)
+    
+    # Bytes que hay que leer completos: archivos sin hash conocido y PDFs
+    pending_bytes = sum(job[3].st_size for job in pending
+                        if job[4] is None or job[0]['extension'] == '.pdf')
+    if len(pending) > 1 and pending_bytes >= SCAN_POOL_MIN_BYTES:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(process, pending))
+    else:
+        results = [process(job) for job in pending]
+    
+    for (file_info, path, relative, stat, sha256), meta in results:
+        file_info.update(meta)
+        new_cache[relative] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                               'meta': meta}
+    
+    # Reescribir la caché sólo si algo cambió
+    if cache_file is not None and (pending or len(new_cache) != len(cache)):
+        save_scan_cache(cache_file, new_cache)
+    
+    print(f" {stats['total_files']} archivos, metadatos calculados: {len(pending)}, "
+          f"en caché: {stats['total_files'] - len(pending)}")
+    stats['total_size'] = format_size(stats['total_size_bytes'])
+    return file_structure, stats
 
-    def render_tree(structure, path_prefix):
-        """Renderizar árbol de archivos"""
-        html = ""
-        
-        # Renderizar archivos del nivel actual primero
-        if 'files' in structure and structure['files']:
-            for file_info in structure['files']:
-                icon_class = get_file_icon(file_info['type'], file_info['extension'])
-                type_color = {
-                    'image': 'success',
-                    'document': 'primary',
-                    'data': 'info',
-                    'other': 'secondary'
-                }.get(file_info['type'], 'secondary')
-                
-                file_link = f"hardware/{file_info['path'].replace('hardware/', '')}"
-                
-                # Configurar enlaces según el tipo de archivo
-                if file_info['type'] == 'image':
-                    # Imágenes: preview modal + enlace directo
-                    click_action = f"previewImage('{file_link}', '{file_info['name']}')"
-                    link_attrs = f'style="cursor: pointer;" onclick="{click_action}" title="Click para vista previa - Ctrl+Click para abrir en nueva pestaña" oncontextmenu="window.open(\'{file_link}\', \'_blank\'); return false;"'
-                elif file_info['extension'].lower() == '.pdf':
-                    # PDFs: abrir en nueva pestaña con viewer integrado
-                    link_attrs = f'href="{file_link}" target="_blank" title="Abrir PDF en nueva pestaña"'
-                else:
-                    # Otros archivos: abrir en nueva pestaña
-                    link_attrs = f'href="{file_link}" target="_blank" title="Abrir archivo en nueva pestaña"'
-                
-                # Agregar enlaces simples según tipo de archivo
-                extra_links = ""
-                if file_info['extension'].lower() == '.pdf':
-                    extra_links = f'''
-                    <small class="ms-2">
-                        <a href="#" onclick="previewPDF('{file_link}', '{file_info['name']}')" title="Vista previa">ver</a> |
-                        <a href="{file_link}" target="_blank" title="Abrir en nueva pestaña">abrir</a> |
-                        <a href="{file_link}" download title="Descargar">descargar</a>
-                    </small>
-                    '''
-                elif file_info['type'] == 'image':
-                    extra_links = f'''
-                    <small class="ms-2">
-                        <a href="#" onclick="previewImage('{file_link}', '{file_info['name']}')" title="Vista previa">ver</a> |
-                        <a href="{file_link}" target="_blank" title="Abrir en nueva pestaña">abrir</a>
-                    </small>
-                    '''
-                
-                html += f'''
-                <div class="d-flex align-items-center justify-content-between file-item">
-                    <div class="d-flex align-items-center flex-grow-1">
-                        <i class="bi {icon_class} file-icon"></i>
-                        <a {link_attrs} class="file-link me-2">{file_info['name']}</a>
-                        <span class="badge bg-{type_color} type-badge me-2">{file_info['type']}</span>
-                        {extra_links}
-                    </div>
-                    <div class="text-end ms-3">
-                        <small class="file-size d-block">{file_info['size_human']}</small>
-                        <small class="file-date">{file_info['modified']}</small>
-                    </div>
-                </div>
-                '''
-        
-        # Renderizar carpetas
-        if 'folders' in structure:
-            for folder_name, folder_data in structure['folders'].items():
-                folder_path = f"{path_prefix}/{folder_name}" if path_prefix else folder_name
-                folder_id = folder_path.replace('/', '_').replace(' ', '_')
-                
-                html += f'''
-                <div class="tree-item">
-                    <div class="d-flex align-items-center file-item" style="cursor: pointer;" onclick="toggleFolder(this)">
-                        <i class="bi bi-chevron-down folder-toggle"></i>
-                        <i class="bi bi-folder-fill folder-icon file-icon"></i>
-                        <strong>{folder_name}</strong>
-                    </div>
-                    <div id="{folder_id}" class="ms-3">
-                '''
-                
-                # Renderizar subcarpetas recursivamente
-                html += render_tree(folder_data, folder_path)
-                
-                html += '''
-                    </div>
-                </div>
-                '''
-        
-        return html
+def iter_files(structure):
+    """Recorrer en memoria los archivos de la estructura escaneada"""
+    yield from structure['files']
+    for folder in structure['folders'].values():
+        yield from iter_files(folder)
+
+def save_webp(image, path):
+    tmp_path = path.with_name(path.name + '.tmp')
+    image.save(tmp_path, 'WEBP', quality=WEB_QUALITY, method=4)
+    os.replace(tmp_path, path)
+
+def make_image_variants(source, thumb_path, web_path):
+    """Crear la miniatura y, si se pide, la variante web de una imagen
+    
+    Se ejecuta en un proceso del pool; la miniatura se reduce desde la
+    variante web para no volver a procesar la imagen completa.
+    """
+    with Image.open(source) as image:
+        if image.format == 'JPEG':
+            # Decodificar directamente a una escala reducida
+            image.draft('RGB', (WEB_SIZE, WEB_SIZE))
+        if image.mode not in ('RGB', 'RGBA'):
+            has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+        image.thumbnail((WEB_SIZE, WEB_SIZE), Image.LANCZOS)
+        if web_path is not None:
+            save_webp(image, web_path)
+        image.thumbnail((THUMB_SIZE, THUMB_SIZE), Image.LANCZOS)
+        save_webp(image, thumb_path)
 
-    # Calcular estadísticas
-    def calculate_stats(structure):
-        stats = {'total_files': 0, 'images': 0, 'documents': 0, 'total_size_bytes': 0}
+def generate_image_variants(file_structure, workers=None):
+    """Generar miniaturas y variantes web de las imágenes en paralelo
+    
+    Los archivos se nombran con el hash del original, así que una imagen
+    sin cambios reutiliza sus variantes y las de imágenes eliminadas se
+    borran. Las imágenes que ya caben en WEB_SIZE no llevan variante web.
+    Agrega 'thumb' (y 'web') a la información de cada imagen.
+    """
+    if Image is None:
+        print(" Pillow no está instalado: se enlazan las imágenes originales")
+        return
+    
+    print(" Generando miniaturas de imágenes...")
+    ensure_directory(PREVIEWS_DIR)
+    jobs = {}
+    referenced = set()
+    images = [info for info in iter_files(file_structure)
+              if info['type'] == 'image' and 'sha256' in info
+              and info['extension'] not in VARIANT_SKIP_EXTENSIONS]
+    
+    for info in images:
+        key = info['sha256'][:20]
+        thumb_path = PREVIEWS_DIR / f"{key}_thumb.webp"
+        web_path = None
+        width, height = info.get('width'), info.get('height')
+        if not width or max(width, height) > WEB_SIZE:
+            web_path = PREVIEWS_DIR / f"{key}_web.webp"
         
-        def count_recursive(struct):
-            # Contar archivos del nivel actual
-            if 'files' in struct:
-                for file_info in struct['files']:
-                    stats['total_files'] += 1
-                    stats['total_size_bytes'] += file_info['size']
-                    if file_info['type'] == 'image':
-                        stats['images'] += 1
-                    elif file_info['type'] == 'document':
-                        stats['documents'] += 1
-            
-            # Recursar en subcarpetas
-            if 'folders' in struct:
-                for folder_name, folder_data in struct['folders'].items():
-                    count_recursive(folder_data)
+        info['thumb'] = thumb_path.relative_to(DOCS_DIR).as_posix()
+        if web_path is not None:
+            info['web'] = web_path.relative_to(DOCS_DIR).as_posix()
+            referenced.add(web_path.name)
+        referenced.add(thumb_path.name)
+        if width and height:
+            scale = min(1.0, THUMB_SIZE / width, THUMB_SIZE / height)
+            info['thumb_width'] = max(1, round(width * scale))
+            info['thumb_height'] = max(1, round(height * scale))
         
-        count_recursive(structure)
-        stats['total_size'] = format_size(stats['total_size_bytes'])
-        return stats
+        missing = not thumb_path.exists() or (web_path is not None and not web_path.exists())
+        if missing and key not in jobs:
+            jobs[key] = (DOCS_DIR / info['path'], thumb_path, web_path)
+    
+    failed = set()
+    if jobs:
+        keys = list(jobs)
+        if len(keys) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(make_image_variants, *jobs[key]) for key in keys]
+                for key, future in zip(keys, futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f" No se pudo procesar {jobs[key][0].name}: {e}")
+                        failed.add(key)
+        else:
+            try:
+                make_image_variants(*jobs[keys[0]])
+            except Exception as e:
+                print(f" No se pudo procesar {jobs[keys[0]][0].name}: {e}")
+                failed.add(keys[0])
+    
+    # Sin variantes: volver al original
+    for info in images:
+        if info['sha256'][:20] in failed:
+            for field in ('thumb', 'web', 'thumb_width', 'thumb_height'):
+                info.pop(field, None)
+    
+    # Borrar variantes de imágenes que ya no existen
+    removed = 0
+    for entry in os.scandir(PREVIEWS_DIR):
+        if entry.name not in referenced:
+            os.unlink(entry.path)
+            removed += 1
+    
+    print(f" Variantes generadas: {len(jobs) - len(failed)}, "
+          f"reutilizadas: {len(set(i['sha256'][:20] for i in images)) - len(jobs)}, "
+          f"eliminadas: {removed}")
+
+_template = None
+
+def get_template():
+    """Plantilla de la página, compilada una sola vez
+    
+    Dentro del proceso se reutiliza el objeto compilado; entre ejecuciones
+    Jinja2 guarda el bytecode en TEMPLATE_CACHE_DIR y no vuelve a parsear
+    la plantilla mientras no cambie.
+    """
+    global _template
+    if _template is None:
+        ensure_directory(TEMPLATE_CACHE_DIR)
+        env = Environment(
+            loader=FileSystemLoader(str(TEMPLATES_DIR)),
+            bytecode_cache=FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR)),
+            keep_trailing_newline=True,
+        )
+        _template = env.get_template(INDEX_TEMPLATE)
+    return _template
+
+def tree_items(folder, prefix=""):
+    """Recorrer el árbol como una secuencia plana para la plantilla
+    
+    Genera {'kind': 'file'}, {'kind': 'open'} y {'kind': 'close'} en el
+    orden de la página (archivos del nivel primero, luego las subcarpetas),
+    de modo que la plantilla los recorre con un único bucle y no anida
+    macros que acumulen la salida de cada nivel.
+    """
+    stack = [(folder, prefix, None)]
+    while stack:
+        current, path, folders = stack.pop()
+        if folders is None:
+            for file_info in current['files']:
+                yield {'kind': 'file', 'file': file_info}
+            folders = iter(current['folders'].items())
+        for name, child in folders:
+            child_path = f"{path}/{name}" if path else name
+            yield {'kind': 'open', 'name': name,
+                   'id': child_path.replace('/', '_').replace(' ', '_')}
+            # Volver a esta carpeta al terminar la subcarpeta
+            stack.append((current, path, folders))
+            stack.append((child, child_path, None))
+            break
+        else:
+            if path != prefix:
+                yield {'kind': 'close'}
 
-    # Preparar datos para el template
+def generate_html_page(file_structure, stats):
+    """Generar página HTML para visualizar los archivos
+    
+    El árbol se pasa a la plantilla como la secuencia plana de tree_items()
+    y la salida se escribe con template.generate(), una parte por elemento,
+    sin armar la página completa en memoria.
+    """
+    print(" Generando página HTML...")
+    
     template_data = {
-        'file_structure': file_structure,
+        'items': tree_items(file_structure),
         'generated_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'stats': calculate_stats(file_structure),
-        'render_tree': render_tree
+        'stats': stats,
     }
     
-    # Renderizar template
-    template = Template(html_template)
-    html_content = template.render(**template_data)
-    
-    # Guardar archivo HTML
+    # Guardar archivo HTML (reemplazo atómico al terminar)
     html_file = DOCS_DIR / "index.html"
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    tmp_file = html_file.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.writelines(get_template().generate(**template_data))
+    os.replace(tmp_file, html_file)
     
     print(f" Página HTML generada: {html_file}")
 
 def main():
-    """Función principal"""
+    """Función principal
+    
+    Opciones:
+        --force  regenerar la página aunque no haya cambios
+        --link   usar hardlinks en lugar de copias cuando sea posible
+    """
     print(" Iniciando proceso de copia y generación de documentación...")
+    force = '--force' in sys.argv[1:]
+    link = '--link' in sys.argv[1:]
     
     try:
-        # Copiar archivos
-        copy_hardware_files()
+        # Sincronizar archivos
+        sync = copy_hardware_files(link=link)
+        manifest = sync['manifest']
+        html_file = DOCS_DIR / "index.html"
         
-        # Escanear archivos copiados
-        file_structure = scan_copied_files()
+        timings = {'copia': sync['seconds']}
+        
+        if sync['changed'] or force or not html_file.exists():
+            t0 = time.perf_counter()
+            
+            # Escanear archivos copiados
+            file_structure, stats = scan_copied_files(known_files=manifest['files'])
+            t1 = time.perf_counter()
+            
+            # Miniaturas y variantes web de las imágenes
+            generate_image_variants(file_structure)
+            t2 = time.perf_counter()
+            
+            # Generar página HTML
+            generate_html_page(file_structure, stats)
+            t3 = time.perf_counter()
+            manifest['scan_seconds'] = t1 - t0
+            manifest['page_seconds'] = t3 - t2
+            timings.update({'escaneo': t1 - t0, 'miniaturas': t2 - t1, 'página': t3 - t2})
+        else:
+            print(" Sin cambios en el manifiesto, se conserva index.html")
+            # Las miniaturas se reutilizan de la caché igualmente: sólo se
+            # ahorran el escaneo y la página
+            sync['saved_seconds'] += manifest['scan_seconds'] + manifest['page_seconds']
         
-        # Generar página HTML
-        generate_html_page(file_structure)
+        save_manifest(manifest)
+        print(f" Tiempo ahorrado estimado: {sync['saved_seconds']:.2f} s")
+        print(" Tiempos: " + ", ".join(f"{name} {seconds:.2f} s"
+                                       for name, seconds in timings.items()))
         
         print("\n Proceso completado exitosamente!")
         print(f" Archivos copiados en: {DOCS_HARDWARE_DIR}")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Extracción de metadatos de archivos de hardware sin dependencias externas:
+número de páginas de un PDF y dimensiones de imágenes PNG, JPEG, GIF, BMP,
+WebP y SVG. Sólo se leen las cabeceras (o el contenido ya leído para el
+hash), nunca se decodifica la imagen completa.
+"""
+
+import re
+import struct
+
+# Objetos /Type /Pages con su /Count (el árbol raíz tiene el total)
+PDF_PAGES_COUNT = re.compile(rb'/Type\s*/Pages\b[^>]*?/Count\s+(\d+)|/Count\s+(\d+)[^>]*?/Type\s*/Pages\b')
+PDF_PAGE = re.compile(rb'/Type\s*/Page\b(?!s)')
+
+SVG_SIZE = re.compile(rb'<svg\b[^>]*>', re.IGNORECASE | re.DOTALL)
+SVG_ATTR = re.compile(rb'\b(width|height|viewBox)\s*=\s*["\']([^"\']*)["\']')
+
+JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+def pdf_page_count(data):
+    """Número de páginas de un PDF (None si no se puede determinar)
+
+    Usa el mayor /Count de los nodos /Pages; si el árbol de páginas está
+    dentro de object streams comprimidos, cuenta los objetos /Page visibles.
+    """
+    counts = [int(a or b) for a, b in PDF_PAGES_COUNT.findall(data)]
+    if counts:
+        return max(counts)
+    pages = len(PDF_PAGE.findall(data))
+    return pages or None
+
+def _svg_length(value):
+    match = re.match(rb'\s*([\d.]+)\s*(px)?\s*$', value)
+    return int(float(match.group(1))) if match else None
+
+def _svg_size(head):
+    tag = SVG_SIZE.search(head)
+    if not tag:
+        return None
+    attrs = {name: value for name, value in SVG_ATTR.findall(tag.group(0))}
+    width = _svg_length(attrs.get(b'width', b''))
+    height = _svg_length(attrs.get(b'height', b''))
+    if (width is None or height is None) and b'viewBox' in attrs:
+        parts = attrs[b'viewBox'].replace(b',', b' ').split()
+        if len(parts) == 4:
+            width, height = int(float(parts[2])), int(float(parts[3]))
+    if width is None or height is None:
+        return None
+    return width, height
+
+def _jpeg_size(f):
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        kind = marker[1]
+        if kind == 0xFF:
+            # Relleno entre marcadores
+            f.seek(-1, 1)
+            continue
+        if kind in (0x01, 0xD8) or 0xD0 <= kind <= 0xD7:
+            continue
+        length = f.read(2)
+        if len(length) < 2:
+            return None
+        (length,) = struct.unpack('>H', length)
+        if kind in JPEG_SOF:
+            data = f.read(5)
+            if len(data) < 5:
+                return None
+            height, width = struct.unpack('>HH', data[1:5])
+            return width, height
+        f.seek(length - 2, 1)
+
+def image_size(f, extension):
+    """(ancho, alto) en píxeles de una imagen abierta en modo binario, o None"""
+    f.seek(0)
+    head = f.read(64)
+    if extension == '.png' and head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+        return struct.unpack('>II', head[16:24])
+    if extension == '.gif' and head[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack('<HH', head[6:10])
+    if extension == '.bmp' and head[:2] == b'BM':
+        width, height = struct.unpack('<ii', head[18:26])
+        return width, abs(height)
+    if extension == '.webp' and head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        chunk = head[12:16]
+        if chunk == b'VP8 ':
+            width, height = struct.unpack('<HH', head[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b'VP8L':
+            bits = int.from_bytes(head[21:25], 'little')
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b'VP8X':
+            return (int.from_bytes(head[24:27], 'little') + 1,
+                    int.from_bytes(head[27:30], 'little') + 1)
+        return None
+    if extension in ('.jpg', '.jpeg') and head[:2] == b'\xff\xd8':
+        return _jpeg_size(f)
+    if extension == '.svg':
+        f.seek(0)
+        return _svg_size(f.read(16384))
+    return None
@@ -0,0 +1,397 @@
+"""
+ICP-10111 Barometric Pressure Sensor Driver - MicroPython
+=========================================================
+
+Minimal driver module: only time, array and icp10111_calibration are
+imported, and tables are either literals or built on first use, so it
+imports quickly and can be frozen or precompiled with mpy-cross:
+
+    mpy-cross icp10111.py
+    mpy-cross icp10111_calibration.py
+
+Optional features live in their own modules and are only loaded by code
+that uses them (icp10111_profile, icp10111_rtc, icp10111_filter, ...).
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import time
+from array import array
+
+from icp10111_calibration import Calibration
+
+try:
+    from time import ticks_ms, ticks_us, ticks_diff, ticks_add, sleep_us, sleep_ms
+except ImportError:
+    # CPython fallbacks so the driver can also run against a fake bus
+    def ticks_ms():
+        return time.perf_counter_ns() // 1000000
+
+    def ticks_us():
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(end, start):
+        return end - start
+
+    def ticks_add(ticks, delta):
+        return ticks + delta
+
+    def sleep_us(us):
+        time.sleep(us / 1000000)
+
+    def sleep_ms(ms):
+        time.sleep(ms / 1000)
+
+# Altitude look-up table over pressure/reference ratios 0.25 - 1.25
+# (about 10.5 km above to 1.7 km below the reference). With linear
+# interpolation between 256 segments the error against the exact formula
+# is below 0.02 m near the reference and below 0.2 m at the range ends.
+ALT_RATIO_MIN = 0.25
+ALT_RATIO_MAX = 1.25
+ALT_SEGMENTS = 256
+
+_altitude_table = None
+
+def _get_altitude_table():
+    """Build the altitude table on first use"""
+    global _altitude_table
+    if _altitude_table is None:
+        step = (ALT_RATIO_MAX - ALT_RATIO_MIN) / ALT_SEGMENTS
+        _altitude_table = array('f', [
+            44330 * (1 - pow(ALT_RATIO_MIN + i * step, 0.1903))
+            for i in range(ALT_SEGMENTS + 1)
+        ])
+    return _altitude_table
+
+# CRC-8 look-up table for polynomial 0x31, stored as a literal so importing
+# the driver (or its frozen .mpy) does not spend time building it
+CRC8_TABLE = (
+    b'\x00\x31\x62\x53\xC4\xF5\xA6\x97\xB9\x88\xDB\xEA\x7D\x4C\x1F\x2E'
+    b'\x43\x72\x21\x10\x87\xB6\xE5\xD4\xFA\xCB\x98\xA9\x3E\x0F\x5C\x6D'
+    b'\x86\xB7\xE4\xD5\x42\x73\x20\x11\x3F\x0E\x5D\x6C\xFB\xCA\x99\xA8'
+    b'\xC5\xF4\xA7\x96\x01\x30\x63\x52\x7C\x4D\x1E\x2F\xB8\x89\xDA\xEB'
+    b'\x3D\x0C\x5F\x6E\xF9\xC8\x9B\xAA\x84\xB5\xE6\xD7\x40\x71\x22\x13'
+    b'\x7E\x4F\x1C\x2D\xBA\x8B\xD8\xE9\xC7\xF6\xA5\x94\x03\x32\x61\x50'
+    b'\xBB\x8A\xD9\xE8\x7F\x4E\x1D\x2C\x02\x33\x60\x51\xC6\xF7\xA4\x95'
+    b'\xF8\xC9\x9A\xAB\x3C\x0D\x5E\x6F\x41\x70\x23\x12\x85\xB4\xE7\xD6'
+    b'\x7A\x4B\x18\x29\xBE\x8F\xDC\xED\xC3\xF2\xA1\x90\x07\x36\x65\x54'
+    b'\x39\x08\x5B\x6A\xFD\xCC\x9F\xAE\x80\xB1\xE2\xD3\x44\x75\x26\x17'
+    b'\xFC\xCD\x9E\xAF\x38\x09\x5A\x6B\x45\x74\x27\x16\x81\xB0\xE3\xD2'
+    b'\xBF\x8E\xDD\xEC\x7B\x4A\x19\x28\x06\x37\x64\x55\xC2\xF3\xA0\x91'
+    b'\x47\x76\x25\x14\x83\xB2\xE1\xD0\xFE\xCF\x9C\xAD\x3A\x0B\x58\x69'
+    b'\x04\x35\x66\x57\xC0\xF1\xA2\x93\xBD\x8C\xDF\xEE\x79\x48\x1B\x2A'
+    b'\xC1\xF0\xA3\x92\x05\x34\x67\x56\x78\x49\x1A\x2B\xBC\x8D\xDE\xEF'
+    b'\x82\xB3\xE0\xD1\x46\x77\x24\x15\x3B\x0A\x59\x68\xFF\xCE\x9D\xAC'
+)
+
+# Profiling stages (see icp10111_profile.Profiler)
+STAGE_INIT = 0
+STAGE_WRITE = 1
+STAGE_WAIT = 2
+STAGE_READ = 3
+STAGE_CONVERT = 4
+STAGE_ALTITUDE = 5
+
+def crc8_word_ok(buf, i):
+    """Check the CRC byte following the 16-bit word at buf[i] (init 0xFF)"""
+    return CRC8_TABLE[CRC8_TABLE[0xFF ^ buf[i]] ^ buf[i + 1]] == buf[i + 2]
+
+class ICP10111:
+    """Driver class for ICP-10111 barometric pressure sensor"""
+    
+    # I2C address (7-bit address)
+    ADDRESS = 0x63
+    
+    # Command codes
+    CMD_READ_ID = 0xEFC8
+    CMD_SET_MODE = 0x6825
+    CMD_READ_DATA = 0x48A3
+    CMD_OTP_SETUP = b'\xC5\x95\x00\x66\x9C\x93'
+    CMD_OTP_READ = 0xC7F7
+    _OTP_READ_CMD = b'\xC7\xF7'
+    
+    # Measurement modes
+    MODE_LOW_POWER = 0
+    MODE_NORMAL = 1
+    MODE_LOW_NOISE = 2
+    MODE_ULTRA_LOW_NOISE = 3
+    
+    # Measurement command per mode (temperature transmitted first)
+    MODE_COMMANDS = (0x609C, 0x6825, 0x70DF, 0x7866)
+    _MODE_CMD_BYTES = (b'\x60\x9C', b'\x68\x25', b'\x70\xDF', b'\x78\x66')
+    
+    # Maximum conversion time per mode in microseconds (datasheet)
+    MODE_CONVERSION_US = (1800, 6300, 23800, 94500)
+    
+    # RMS pressure noise per mode in Pa (datasheet)
+    MODE_NOISE_PA = (3.2, 1.6, 0.8, 0.4)
+    
+    def __init__(self, i2c, address=ADDRESS, mode=MODE_NORMAL, max_retries=2,
+                 profiler=None, otp=None, combined=True):
+        """Initialize the sensor
+        
+        Pass otp (the four calibration constants, e.g. restored by
+        icp10111_rtc) to skip reading them from the sensor.
+        
+        With combined=True, command/read pairs (OTP readout) are sent as
+        one write + repeated START + read transaction (readfrom_mem_into
+        with a 16-bit command as memory address) instead of two separate
+        transactions. This only affects initialisation: a measurement
+        is always a command write and, after the conversion time, a
+        separate read.
+        """
+        self.i2c = i2c
+        self.address = address
+        self.mode = mode
+        self.combined = combined
+        self.reference_pressure = None
+        
+        # Optional stage timing; None costs one attribute check per call
+        self.profiler = profiler
+        
+        # Re-reads allowed per frame when a CRC check fails
+        self.max_retries = max_retries
+        self.crc_errors = 0
+        self.retries = 0
+        self.failed_reads = 0
+        
+        # Fast altitude constants derived from the reference pressure
+        self._alt_table = None
+        self._alt_scale = 0.0
+        self._alt_offset = 0.0
+        
+        # Tick at which the pending conversion is complete (None when idle)
+        self._deadline = None
+        
+        # Conversion engine built from the OTP constants in _init_sensor
+        self.calibration = None
+        
+        # Command bytes and read buffers are built once so the sampling
+        # hot path does not allocate
+        self._measure_cmds = self._MODE_CMD_BYTES
+        self._otp_read_cmd = self._OTP_READ_CMD
+        self._buf = bytearray(9)
+        self._otp_buf = memoryview(self._buf)[:3]
+        
+        # Last raw words and reusable [temperature °C, pressure hPa] result
+        self.raw_t = 0
+        self.raw_p = 0
+        self._result = array('f', (0.0, 0.0))
+        
+        # Initialize sensor
+        self._init_sensor(otp)
+    
+    def _init_sensor(self, otp=None):
+        """Initialize sensor settings"""
+        prof = self.profiler
+        if prof is not None:
+            t0 = ticks_us()
+        
+        # OTP calibration constants only need to be read once per sensor
+        if otp is None:
+            otp = self._read_otp()
+        self.calibration = Calibration(otp)
+        
+        if prof is not None:
+            prof.record(STAGE_INIT, ticks_diff(ticks_us(), t0))
+    
+    def _read_otp(self):
+        """Read the four signed 16-bit OTP calibration constants"""
+        self.i2c.writeto(self.address, self.CMD_OTP_SETUP)
+        
+        otp = []
+        for _ in range(4):
+            # Each word is followed by a CRC byte
+            if self.combined:
+                self._read_checked(self._otp_buf, 1, self.CMD_OTP_READ)
+            else:
+                self.i2c.writeto(self.address, self._otp_read_cmd)
+                self._read_checked(self._otp_buf, 1)
+            word = (self._buf[0] << 8) | self._buf[1]
+            otp.append(word - 0x10000 if word & 0x8000 else word)
+        return otp
+    
+    def _read_checked(self, buf, words, cmd=None):
+        """Read CRC-protected words into buf, re-reading corrupt frames
+        
+        If cmd is given it is written in the same transaction as the first
+        read; re-reads never repeat it, since commands such as the OTP read
+        advance the sensor's internal pointer.
+        """
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.retries += 1
+            if cmd is not None and not attempt:
+                self.i2c.readfrom_mem_into(self.address, cmd, buf, addrsize=16)
+            else:
+                self.i2c.readfrom_into(self.address, buf)
+            i = 0
+            while i < 3 * words and crc8_word_ok(buf, i):
+                i += 3
+            if i == 3 * words:
+                return
+            self.crc_errors += 1
+        self.failed_reads += 1
+        raise RuntimeError("ICP-10111 CRC mismatch")
+    
+    def start_measurement(self, mode=None):
+        """Trigger a conversion and return immediately"""
+        if mode is None:
+            mode = self.mode
+        
+        prof = self.profiler
+        if prof is not None:
+            t0 = ticks_us()
+        
+        self.i2c.writeto(self.address, self._measure_cmds[mode])
+        self._deadline = ticks_add(ticks_us(), self.MODE_CONVERSION_US[mode])
+        
+        if prof is not None:
+            prof.record(STAGE_WRITE, ticks_diff(ticks_us(), t0))
+    
+    def time_remaining_us(self):
+        """Microseconds until the pending conversion is complete"""
+        if self._deadline is None:
+            raise RuntimeError("No measurement in progress")
+        return max(0, ticks_diff(self._deadline, ticks_us()))
+    
+    def ready(self):
+        """Check whether the pending conversion has finished"""
+        return self.time_remaining_us() == 0
+    
+    def collect_raw(self):
+        """Read the pending conversion into raw_t/raw_p
+        
+        Waits only for whatever is left of the conversion time, so calling
+        it after ready() returns True never blocks.
+        """
+        prof = self.profiler
+        if prof is not None:
+            t0 = ticks_us()
+        
+        remaining = self.time_remaining_us()
+        if remaining:
+            sleep_us(remaining)
+        self._deadline = None
+        
+        if prof is not None:
+            t1 = ticks_us()
+            prof.record(STAGE_WAIT, ticks_diff(t1, t0))
+        
+        # Read 9 bytes: T word, P high word, P low word, each with a CRC byte
+        data = self._buf
+        self._read_checked(data, 3)
+        
+        if prof is not None:
+            prof.record(STAGE_READ, ticks_diff(ticks_us(), t1))
+        
+        # Parse temperature (16 bits)
+        self.raw_t = (data[0] << 8) | data[1]
+        
+        # Parse pressure (24 bits, lowest byte of the last word is unused)
+        self.raw_p = (data[3] << 16) | (data[4] << 8) | data[6]
+    
+    def collect(self):
+        """Read the result of the pending conversion"""
+        self.collect_raw()
+        
+        prof = self.profiler
+        if prof is not None:
+            t0 = ticks_us()
+        
+        temperature, pressure = self.calibration.convert(self.raw_t, self.raw_p)
+        
+        if prof is not None:
+            prof.record(STAGE_CONVERT, ticks_diff(ticks_us(), t0))
+        return temperature, pressure / 100.0  # Convert to hPa
+    
+    def collect_into(self, out):
+        """Read the pending conversion into out[0] (°C) and out[1] (hPa)"""
+        self.collect_raw()
+        
+        prof = self.profiler
+        if prof is not None:
+            t0 = ticks_us()
+        
+        calibration = self.calibration
+        out[0] = calibration.temperature(self.raw_t)
+        out[1] = calibration.pressure(self.raw_t, self.raw_p) / 100.0
+        
+        if prof is not None:
+            prof.record(STAGE_CONVERT, ticks_diff(ticks_us(), t0))
+        return out
+    
+    def convert(self, raw_t, raw_p):
+        """Convert raw words to (temperature in °C, pressure in Pa)"""
+        return self.calibration.convert(raw_t, raw_p)
+    
+    def read_sensor_data(self):
+        """Read temperature and pressure from sensor"""
+        self.start_measurement()
+        return self.collect()
+    
+    def read(self, out=None):
+        """Allocation-free read_sensor_data
+        
+        Fills out (default: an array reused on every call) with
+        [temperature °C, pressure hPa] instead of returning a new tuple.
+        """
+        self.start_measurement()
+        return self.collect_into(self._result if out is None else out)
+    
+    def calculate_altitude(self, pressure, reference_pressure=101325):
+        """Calculate altitude using barometric formula"""
+        if reference_pressure is None:
+            reference_pressure = 101325  # Standard sea level pressure in Pa
+        
+        prof = self.profiler
+        if prof is not None:
+            t0 = ticks_us()
+        
+        # Barometric formula
+        altitude = 44330 * (1 - pow(pressure / reference_pressure, 0.1903))
+        
+        if prof is not None:
+            prof.record(STAGE_ALTITUDE, ticks_diff(ticks_us(), t0))
+        return altitude
+    
+    def fast_altitude(self, pressure):
+        """Altitude in meters from the look-up table (pressure in Pa)
+        
+        Uses the reference from set_reference_pressure (standard sea level
+        if none was set). Costs a few multiply/adds instead of pow(); falls
+        back to the exact formula outside the table range.
+        """
+        if self._alt_table is None:
+            self.set_reference_pressure(self.reference_pressure)
+        
+        # Fractional table index straight from the pressure
+        x = pressure * self._alt_scale - self._alt_offset
+        i = int(x)
+        if i < 0 or i >= ALT_SEGMENTS:
+            return self.calculate_altitude(pressure, self.reference_pressure)
+        
+        prof = self.profiler
+        if prof is not None:
+            t0 = ticks_us()
+        
+        table = self._alt_table
+        y0 = table[i]
+        altitude = y0 + (table[i + 1] - y0) * (x - i)
+        
+        if prof is not None:
+            prof.record(STAGE_ALTITUDE, ticks_diff(ticks_us(), t0))
+        return altitude
+    
+    def set_reference_pressure(self, pressure):
+        """Set reference pressure for altitude calculation"""
+        self.reference_pressure = pressure
+        
+        # Fold the reference into the table index: x = p * scale - offset
+        if pressure is None:
+            pressure = 101325
+        step = (ALT_RATIO_MAX - ALT_RATIO_MIN) / ALT_SEGMENTS
+        self._alt_scale = 1 / (pressure * step)
+        self._alt_offset = ALT_RATIO_MIN / step
+        self._alt_table = _get_altitude_table()
@@ -0,0 +1,204 @@
+"""
+Warning: This file is not tested, use at your own risk.
+
+ICP-10111 Adaptive Sampling - MicroPython
+=========================================
+
+Adjusts the measurement mode and interval to how fast pressure changes.
+While pressure is flat the sensor runs in low-power mode every 10 s;
+when |dP/dt| crosses the configured thresholds it steps up to normal
+mode at 1 Hz and then ultra-low-noise mode at 5 Hz, and steps back down
+once the rate has stayed low for a few samples.
+
+AdaptiveRate holds the decision logic only and can be fed from recorded
+traces on a desktop; AdaptiveSampler drives a real ICP10111 with it and
+reports the current mode and the duty cycle and current estimated from
+the datasheet conversion times and supply currents. A failed measurement
+(CRC error or I2C OSError) is counted in errors and retried one interval
+later instead of stopping the sampler.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+from icp10111 import ICP10111, ticks_ms, ticks_diff, ticks_add, sleep_ms
+
+# (mode, interval ms) per level, slowest first
+LEVELS = (
+    (ICP10111.MODE_LOW_POWER, 10000),
+    (ICP10111.MODE_NORMAL, 1000),
+    (ICP10111.MODE_ULTRA_LOW_NOISE, 200),
+)
+
+# |dP/dt| in Pa/s needed to enter each level above the first
+RATE_THRESHOLDS = (0.3, 3.0)
+
+# RMS pressure noise per mode in Pa (datasheet). Pressure differences
+# within noise_factor * sqrt(2) * noise are treated as no change, so
+# noise alone cannot keep the sampler in a fast level.
+MODE_NOISE_PA = ICP10111.MODE_NOISE_PA
+
+# Charge per measurement in uC: datasheet current at one sample per second
+MODE_CHARGE_UC = (1.3, 2.6, 5.2, 10.4)
+
+
+class AdaptiveRate:
+    """Chooses a sampling level from the pressure rate of change"""
+
+    def __init__(self, levels=LEVELS, thresholds=RATE_THRESHOLDS, hold=5, alpha=0.5,
+                 noise_factor=2.0):
+        self.levels = levels
+        self.thresholds = thresholds
+        self.hold = hold      # Calm samples needed before stepping down
+        self.alpha = alpha    # Smoothing of the dP/dt estimate
+        self.noise_floor = tuple(noise_factor * 1.414 * n for n in MODE_NOISE_PA)
+        self.reset()
+
+    def reset(self):
+        self.level = 0
+        self.rate = 0.0
+        self._calm = 0
+        self._last_time = None
+        self._last_pressure = 0.0
+
+    @property
+    def mode(self):
+        return self.levels[self.level][0]
+
+    @property
+    def interval_ms(self):
+        return self.levels[self.level][1]
+
+    def _target_level(self, rate):
+        level = 0
+        for threshold in self.thresholds:
+            if rate >= threshold:
+                level += 1
+        return level
+
+    def update(self, timestamp_ms, pressure):
+        """Feed a sample (Pa) and return the interval to the next one (ms)"""
+        if self._last_time is not None:
+            dt = ticks_diff(timestamp_ms, self._last_time)
+            if dt > 0:
+                change = abs(pressure - self._last_pressure) - self.noise_floor[self.mode]
+                rate = change * 1000 / dt if change > 0 else 0.0
+                self.rate += self.alpha * (rate - self.rate)
+        self._last_time = timestamp_ms
+        self._last_pressure = pressure
+
+        target = self._target_level(self.rate)
+        if target > self.level:
+            # React immediately to faster changes
+            self.level = target
+            self._calm = 0
+        elif target < self.level:
+            self._calm += 1
+            if self._calm >= self.hold:
+                self.level -= 1
+                self._calm = 0
+        else:
+            self._calm = 0
+        return self.interval_ms
+
+
+class AdaptiveSampler:
+    """Runs an ICP10111 at the rate chosen by AdaptiveRate"""
+
+    def __init__(self, sensor, policy=None):
+        self.sensor = sensor
+        self.policy = policy or AdaptiveRate()
+        self.temperature = 0.0
+        self.pressure = 0.0
+        self.samples = 0
+        self.errors = 0
+
+        self._start_ms = ticks_ms()
+        self._next_ms = self._start_ms
+        self._measuring = False
+        self._busy_us = 0
+        self._charge_uc = 0.0
+
+    @property
+    def mode(self):
+        return self.policy.mode
+
+    def poll(self):
+        """Advance the schedule without blocking; True when a sample arrived"""
+        sensor = self.sensor
+        now = ticks_ms()
+        if not self._measuring:
+            if ticks_diff(now, self._next_ms) >= 0:
+                mode = self.policy.mode
+                try:
+                    sensor.start_measurement(mode)
+                except OSError:
+                    self._retry_later(now)
+                    return False
+                self._busy_us += sensor.MODE_CONVERSION_US[mode]
+                self._charge_uc += MODE_CHARGE_UC[mode]
+                self._measuring = True
+            return False
+
+        if not sensor.ready():
+            return False
+        self._measuring = False
+        try:
+            sensor.collect_raw()
+        except (RuntimeError, OSError):
+            # Corrupt frame after the driver's CRC retries, or a bus error
+            self._retry_later(now)
+            return False
+        self.temperature, self.pressure = sensor.convert(sensor.raw_t, sensor.raw_p)
+        self.samples += 1
+
+        interval = self.policy.update(now, self.pressure)
+        self._next_ms = ticks_add(now, interval)
+        return True
+
+    def _retry_later(self, now):
+        """Skip the failed sample and try again one interval later"""
+        self.errors += 1
+        self._next_ms = ticks_add(now, self.policy.interval_ms)
+
+    def ms_until_next(self):
+        """Time the caller can sleep (e.g. machine.lightsleep) before poll()"""
+        if self._measuring:
+            return self.sensor.time_remaining_us() // 1000
+        return max(0, ticks_diff(self._next_ms, ticks_ms()))
+
+    def elapsed_ms(self):
+        return max(1, ticks_diff(ticks_ms(), self._start_ms))
+
+    def duty_cycle(self):
+        """Estimated fraction of time spent converting (nominal conversion
+        times of the modes used, not measured)"""
+        return self._busy_us / (self.elapsed_ms() * 1000)
+
+    def average_current_ua(self):
+        """Estimated sensor current from the measurements taken so far"""
+        return self._charge_uc * 1000 / self.elapsed_ms()
+
+
+def main():
+    """Adaptive sampling with a status line per sample"""
+    from machine import Pin, I2C
+
+    i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=400000)
+    sampler = AdaptiveSampler(ICP10111(i2c))
+    mode_names = ("LP", "N", "LN", "ULN")
+
+    try:
+        while True:
+            if sampler.poll():
+                print(f"{sampler.pressure:10.1f} Pa | {mode_names[sampler.mode]:3s} | "
+                      f"dP/dt {sampler.policy.rate:6.2f} Pa/s | "
+                      f"est. duty {sampler.duty_cycle() * 100:5.2f}% | "
+                      f"{sampler.average_current_ua():5.2f} uA")
+            sleep_ms(sampler.ms_until_next())
+    except KeyboardInterrupt:
+        print("\nSampling stopped by user")
+
+
+if __name__ == "__main__":
+    main()
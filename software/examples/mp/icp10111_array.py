@@ -0,0 +1,158 @@
+"""
+Warning: This file is not tested, use at your own risk.
+
+ICP-10111 Sensor Array - MicroPython
+====================================
+
+Runs several ICP-10111 sensors behind a TCA9548A I2C multiplexer. Every
+sensor uses the fixed address 0x63, so each one sits on its own mux
+channel.
+
+read_all() starts a conversion on every channel first and only then
+collects the results, so N sensors take about one conversion time
+instead of N. Each channel keeps its own driver instance, and with it
+its own OTP calibration cache. The mux is disabled again after setup,
+start_all() and collect_all(), so no sensor is left on the main bus
+between calls.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import time
+from array import array
+
+from icp10111 import ICP10111, ticks_us, ticks_diff
+
+
+class TCA9548A:
+    """Minimal TCA9548A / PCA9548A 8-channel I2C multiplexer driver"""
+
+    ADDRESS = 0x70
+
+    def __init__(self, i2c, address=ADDRESS):
+        self.i2c = i2c
+        self.address = address
+        self.channel = None
+        self._channel_cmds = tuple(bytes((1 << ch,)) for ch in range(8))
+
+    def select(self, channel):
+        """Route the bus to one channel (skipped if already selected)"""
+        if channel != self.channel:
+            self.i2c.writeto(self.address, self._channel_cmds[channel])
+            self.channel = channel
+
+    def disable(self):
+        """Disconnect all channels"""
+        self.i2c.writeto(self.address, b'\x00')
+        self.channel = None
+
+
+class ChannelStats:
+    """Start-to-result latency statistics for one channel"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def add(self, latency_us):
+        if self.count == 0 or latency_us < self.min_us:
+            self.min_us = latency_us
+        if latency_us > self.max_us:
+            self.max_us = latency_us
+        self.total_us += latency_us
+        self.count += 1
+
+    @property
+    def mean_us(self):
+        return self.total_us / self.count if self.count else 0
+
+
+class SensorArray:
+    """ICP-10111 sensors on TCA9548A channels, measured in parallel"""
+
+    def __init__(self, i2c, mux, channels, mode=ICP10111.MODE_NORMAL):
+        self.mux = mux
+        self.channels = tuple(channels)
+        self.mode = mode
+
+        # One driver (and OTP calibration) per channel
+        self.sensors = []
+        for channel in self.channels:
+            mux.select(channel)
+            self.sensors.append(ICP10111(i2c, mode=mode))
+        mux.disable()
+
+        self.stats = [ChannelStats() for _ in self.channels]
+        self._started = array('l', [0] * len(self.channels))
+
+        # Reusable [t0, p0, t1, p1, ...] result in °C and hPa
+        self._result = array('f', [0.0] * (2 * len(self.channels)))
+
+    def __len__(self):
+        return len(self.channels)
+
+    def start_all(self, mode=None):
+        """Trigger a conversion on every channel"""
+        for i, channel in enumerate(self.channels):
+            self.mux.select(channel)
+            self.sensors[i].start_measurement(mode)
+            self._started[i] = ticks_us()
+        self.mux.disable()
+
+    def collect_all(self, out=None):
+        """Collect every channel into out as [t0, p0, t1, p1, ...]
+
+        Conversions finish in the order they were started, so at most
+        the first channel waits; the rest are normally ready.
+        """
+        if out is None:
+            out = self._result
+        for i, channel in enumerate(self.channels):
+            sensor = self.sensors[i]
+            self.mux.select(channel)
+            sensor.collect_raw()
+            self.stats[i].add(ticks_diff(ticks_us(), self._started[i]))
+
+            calibration = sensor.calibration
+            out[2 * i] = calibration.temperature(sensor.raw_t)
+            out[2 * i + 1] = calibration.pressure(sensor.raw_t, sensor.raw_p) / 100.0
+        self.mux.disable()
+        return out
+
+    def read_all(self, out=None, mode=None):
+        """Measure all channels, see collect_all for the result layout"""
+        self.start_all(mode)
+        return self.collect_all(out)
+
+    def report(self):
+        """Print per-channel latency statistics"""
+        print("Ch | Samples | Min(us) | Mean(us) | Max(us)")
+        for channel, stats in zip(self.channels, self.stats):
+            print(f"{channel:2d} | {stats.count:7d} | {stats.min_us:7d} | "
+                  f"{stats.mean_us:8.0f} | {stats.max_us:7d}")
+
+
+def main():
+    """Read four sensors on mux channels 0-3 once per second"""
+    from machine import Pin, I2C
+
+    i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=400000)
+    mux = TCA9548A(i2c)
+    sensors = SensorArray(i2c, mux, channels=(0, 1, 2, 3))
+
+    try:
+        while True:
+            values = sensors.read_all()
+            for i, channel in enumerate(sensors.channels):
+                print(f"ch{channel}: {values[2 * i]:6.2f} C  {values[2 * i + 1]:8.2f} hPa")
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print()
+        sensors.report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Warning: This file is not tested, use at your own risk.
+
+ICP-10111 Async Driver - MicroPython uasyncio / CPython asyncio
+===============================================================
+
+Awaitable wrapper around the ICP10111 driver. read() holds the bus only
+while a command or result is transferred and yields to other tasks
+during the conversion, so several sensors and an SSD1306 display can
+share one I2C bus without dead time.
+
+All drivers on the same bus share a lock from bus_lock(i2c); use it
+around any other transfers on that bus (e.g. oled.show()). Concurrent
+read() calls on one sensor are serialised by a per-sensor lock, so a
+second measurement never starts before the first has been collected.
+Locks are created lazily inside the running event loop.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+from icp10111 import ICP10111
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+# One (event loop, lock) per bus object, shared by every driver using that
+# bus. Keyed by the bus itself, not id(), so a collected bus cannot hand
+# its lock to a new one.
+_bus_locks = {}
+
+
+def _loop_lock(locks, key):
+    """Lock for key in the running event loop, created on first use"""
+    loop = asyncio.get_event_loop()
+    entry = locks.get(key)
+    if entry is None or entry[0] is not loop:
+        # Locks belong to one loop: make a new one after asyncio.run() again
+        entry = (loop, asyncio.Lock())
+        locks[key] = entry
+    return entry[1]
+
+
+def bus_lock(i2c):
+    """Return the lock serialising transfers on the given I2C bus
+
+    Call it from a running task so the lock belongs to that event loop.
+    """
+    return _loop_lock(_bus_locks, i2c)
+
+
+class AsyncICP10111:
+    """ICP-10111 driver for uasyncio/asyncio event loops"""
+
+    def __init__(self, i2c, address=ICP10111.ADDRESS, mode=ICP10111.MODE_NORMAL):
+        """Initialize the sensor (reads the OTP calibration synchronously)"""
+        self.sensor = ICP10111(i2c, address, mode)
+        self.i2c = i2c
+        self._locks = {}
+
+    @property
+    def lock(self):
+        """Bus lock shared with the other drivers on this bus"""
+        return bus_lock(self.i2c)
+
+    async def read_raw(self, mode=None):
+        """Measure and leave the raw words in sensor.raw_t/raw_p"""
+        sensor = self.sensor
+        # Held from start to collect: one measurement in flight per sensor
+        async with _loop_lock(self._locks, 'sensor'):
+            bus = self.lock
+            async with bus:
+                sensor.start_measurement(mode)
+
+            # The bus is free while the sensor converts
+            await asyncio.sleep(sensor.time_remaining_us() / 1000000)
+
+            async with bus:
+                sensor.collect_raw()
+
+    async def read(self, mode=None):
+        """Read (temperature °C, pressure hPa) without blocking the loop"""
+        await self.read_raw(mode)
+        sensor = self.sensor
+        temperature, pressure = sensor.convert(sensor.raw_t, sensor.raw_p)
+        return temperature, pressure / 100.0
+
+    def calculate_altitude(self, pressure, reference_pressure=101325):
+        """Calculate altitude using barometric formula"""
+        return self.sensor.calculate_altitude(pressure, reference_pressure)
+
+
+async def _sensor_task(sensor, state):
+    while True:
+        state[0], state[1] = await sensor.read()
+        await asyncio.sleep(0.1)
+
+
+async def _display_task(oled, lock, state):
+    while True:
+        oled.fill(0)
+        oled.text("ICP-10111 Sensor", 0, 0)
+        oled.text(f"Temp: {state[0]:.1f}C", 0, 16)
+        oled.text(f"Press: {state[1]:.0f}hPa", 0, 24)
+        async with lock:
+            oled.show()
+        await asyncio.sleep(0.5)
+
+
+def main():
+    """Sensor and display sharing one bus from a single event loop"""
+    from machine import Pin, I2C
+    import ssd1306
+
+    i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=400000)
+    oled = ssd1306.SSD1306_I2C(128, 64, i2c)
+    sensor = AsyncICP10111(i2c)
+    state = [0.0, 0.0]
+
+    async def run():
+        asyncio.create_task(_sensor_task(sensor, state))
+        await _display_task(oled, bus_lock(i2c), state)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nStopped by user")
+
+
+if __name__ == "__main__":
+    main()
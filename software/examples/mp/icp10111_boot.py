@@ -0,0 +1,69 @@
+"""
+Warning: This file is not tested, use at your own risk.
+
+ICP-10111 Boot-to-First-Reading Benchmark - MicroPython
+=======================================================
+
+Measures how long it takes from a fresh start until the first
+temperature/pressure value is available, split into stages:
+
+- import:  importing the driver module (compare .py, .mpy and frozen)
+- init:    creating ICP10111, cold (OTP readout) or warm (RTC cache)
+- measure: first measurement, conversion wait and result conversion
+
+Run it as main.py right after a reset so the import is not cached; the
+first boot reports a cold start and stores the calibration in RTC
+memory, the following ones (e.g. after machine.deepsleep) a warm start.
+Clear the cache with machine.RTC().memory(b'') to measure cold again.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import sys
+
+from icp10111 import ticks_us, ticks_diff
+
+# Imported above only for its clock: unload the driver so the import
+# stage below measures a fresh load of both modules
+DRIVER_MODULES = ("icp10111", "icp10111_calibration")
+
+
+def main(mode=0):
+    """Time one boot and print the stage breakdown in microseconds"""
+    for name in DRIVER_MODULES:
+        sys.modules.pop(name, None)
+    t0 = ticks_us()
+    from icp10111 import ICP10111
+    t_import = ticks_us()
+
+    from machine import Pin, I2C
+    from icp10111_rtc import load_otp, save_otp
+
+    i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=400000)
+    otp = load_otp()
+    t1 = ticks_us()
+    sensor = ICP10111(i2c, mode=mode, otp=otp)
+    t_init = ticks_us()
+    temperature, pressure = sensor.read_sensor_data()
+    t_read = ticks_us()
+
+    if otp is None:
+        save_otp(sensor)
+
+    import_us = ticks_diff(t_import, t0)
+    init_us = ticks_diff(t_init, t1)
+    read_us = ticks_diff(t_read, t_init)
+    print("ICP-10111 boot-to-first-reading")
+    print("=" * 31)
+    print(f"Start:    {'warm (RTC cache)' if otp is not None else 'cold (OTP read)'}")
+    print(f"import:   {import_us:8d} us")
+    print(f"init:     {init_us:8d} us")
+    print(f"measure:  {read_us:8d} us  (mode {mode}, "
+          f"{ICP10111.MODE_CONVERSION_US[mode]} us conversion)")
+    print(f"total:    {import_us + init_us + read_us:8d} us")
+    print(f"Reading:  {temperature:.2f} °C, {pressure:.2f} hPa")
+
+
+if __name__ == "__main__":
+    main()
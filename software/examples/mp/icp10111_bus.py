@@ -0,0 +1,90 @@
+"""
+ICP-10111 I2C Bus Counter - MicroPython
+=======================================
+
+CountingI2C wraps an I2C bus and counts what goes over the wire:
+transactions (START ... STOP), START conditions including repeated
+STARTs, and payload bytes written and read. Use it to compare access
+patterns, e.g. separate command and read transactions against combined
+ones:
+
+    from icp10111_bus import CountingI2C
+    bus = CountingI2C(i2c)
+    sensor = ICP10111(bus)
+    bus.reset()
+    for _ in range(100):
+        sensor.read_sensor_data()
+    bus.report(100)
+
+The wrapper forwards to the real bus unchanged, so it can stay in place
+(e.g. for an SSD1306 sharing the bus); each call costs one extra Python
+call and a few integer additions.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+
+class CountingI2C:
+    """machine.I2C proxy that counts transactions and bytes"""
+
+    def __init__(self, i2c):
+        self.i2c = i2c
+        self.reset()
+
+    def reset(self):
+        self.transactions = 0
+        self.starts = 0
+        self.tx_bytes = 0
+        self.rx_bytes = 0
+
+    def _count(self, starts, tx, rx):
+        self.transactions += 1
+        self.starts += starts
+        self.tx_bytes += tx
+        self.rx_bytes += rx
+
+    def scan(self):
+        return self.i2c.scan()
+
+    def writeto(self, addr, buf, stop=True):
+        self._count(1, len(buf), 0)
+        return self.i2c.writeto(addr, buf, stop)
+
+    def writevto(self, addr, vector, stop=True):
+        self._count(1, sum(len(buf) for buf in vector), 0)
+        return self.i2c.writevto(addr, vector, stop)
+
+    def readfrom(self, addr, nbytes, stop=True):
+        self._count(1, 0, nbytes)
+        return self.i2c.readfrom(addr, nbytes, stop)
+
+    def readfrom_into(self, addr, buf, stop=True):
+        self._count(1, 0, len(buf))
+        return self.i2c.readfrom_into(addr, buf, stop)
+
+    def writeto_mem(self, addr, memaddr, buf, *, addrsize=8):
+        self._count(1, addrsize // 8 + len(buf), 0)
+        return self.i2c.writeto_mem(addr, memaddr, buf, addrsize=addrsize)
+
+    def readfrom_mem(self, addr, memaddr, nbytes, *, addrsize=8):
+        # Address write, repeated START, read
+        self._count(2, addrsize // 8, nbytes)
+        return self.i2c.readfrom_mem(addr, memaddr, nbytes, addrsize=addrsize)
+
+    def readfrom_mem_into(self, addr, memaddr, buf, *, addrsize=8):
+        self._count(2, addrsize // 8, len(buf))
+        return self.i2c.readfrom_mem_into(addr, memaddr, buf, addrsize=addrsize)
+
+    def wire_bytes(self):
+        """Bytes clocked on the bus: payload plus one address byte per START"""
+        return self.starts + self.tx_bytes + self.rx_bytes
+
+    def report(self, samples=1):
+        """Print totals and per-sample averages"""
+        n = max(samples, 1)
+        print(f"Transactions: {self.transactions:6d} ({self.transactions / n:.2f}/sample)")
+        print(f"STARTs:       {self.starts:6d} ({self.starts / n:.2f}/sample)")
+        print(f"Bytes out:    {self.tx_bytes:6d} ({self.tx_bytes / n:.2f}/sample)")
+        print(f"Bytes in:     {self.rx_bytes:6d} ({self.rx_bytes / n:.2f}/sample)")
+        print(f"Wire bytes:   {self.wire_bytes():6d} ({self.wire_bytes() / n:.2f}/sample)")
@@ -0,0 +1,98 @@
+"""
+ICP-10111 Calibration and Conversion - MicroPython / Python
+===========================================================
+
+Converts raw ICP-10111 readings to temperature and pressure using the
+four calibration constants stored in the sensor OTP memory.
+
+The module has no hardware dependencies, so the same code runs on the
+board and on a desktop Python interpreter over recorded raw data:
+
+    from icp10111_calibration import Calibration
+    cal = Calibration((c0, c1, c2, c3))
+    temperature_c, pressure_pa = cal.convert(raw_t, raw_p)
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+# Calibration pressure points in Pa (ICP-101xx application note)
+P_PA_CALIB = (45000.0, 80000.0, 105000.0)
+
+# Look-up table limits and scaling factors
+LUT_LOWER = 3.5 * (1 << 20)
+LUT_UPPER = 11.5 * (1 << 20)
+QUADR_FACTOR = 1 / 16777216.0
+OFFST_FACTOR = 2048.0
+
+# Temperature conversion: T = -45 + 175 / 2^16 * raw_t
+TEMP_OFFSET = -45.0
+TEMP_SCALE = 175.0 / 65536.0
+
+
+class Calibration:
+    """Pressure/temperature conversion from cached OTP constants"""
+
+    def __init__(self, otp):
+        """Precompute the conversion coefficients from the OTP words"""
+        self.otp = tuple(otp)
+        c0, c1, c2, c3 = self.otp
+
+        # The three LUT points are offset + k * t^2 with t = raw_t - 32768
+        self._k1 = c0 * QUADR_FACTOR
+        self._k2 = c1 * QUADR_FACTOR
+        self._k3 = c2 * QUADR_FACTOR
+        self._s2_offset = OFFST_FACTOR * c3
+
+        # Constant pressure differences of the calibration points
+        p0, p1, p2 = P_PA_CALIB
+        self._p0 = p0
+        self._p1 = p1
+        self._d01 = p0 - p1
+        self._d12 = p1 - p2
+        self._d20 = p2 - p0
+
+        # Coefficients for the last temperature word seen
+        self._last_raw_t = None
+        self._a = 0.0
+        self._b = 0.0
+        self._c = 0.0
+
+    def _update_coefficients(self, raw_t):
+        """Solve the pressure curve A + B / (C + raw_p) for one raw_t"""
+        t = raw_t - 32768
+        tt = t * t
+        s1 = LUT_LOWER + self._k1 * tt
+        s2 = self._s2_offset + self._k2 * tt
+        s3 = LUT_UPPER + self._k3 * tt
+
+        d01 = self._d01
+        d12 = self._d12
+        d20 = self._d20
+        c = ((s1 * s2 * d01 + s2 * s3 * d12 + s3 * s1 * d20) /
+             (s3 * d01 + s1 * d12 + s2 * d20))
+        a = (self._p0 * s1 - self._p1 * s2 + d01 * c) / (s1 - s2)
+
+        self._a = a
+        self._b = (self._p0 - a) * (s1 + c)
+        self._c = c
+        self._last_raw_t = raw_t
+
+    def temperature(self, raw_t):
+        """Convert a raw temperature word to degrees Celsius"""
+        return TEMP_OFFSET + TEMP_SCALE * raw_t
+
+    def pressure(self, raw_t, raw_p):
+        """Convert a raw pressure word to Pa
+
+        The curve coefficients depend only on the temperature word, so they
+        are reused while raw_t stays the same and a sample costs one add and
+        one divide.
+        """
+        if raw_t != self._last_raw_t:
+            self._update_coefficients(raw_t)
+        return self._a + self._b / (self._c + raw_p)
+
+    def convert(self, raw_t, raw_p):
+        """Convert raw words to (temperature in °C, pressure in Pa)"""
+        return self.temperature(raw_t), self.pressure(raw_t, raw_p)
@@ -0,0 +1,304 @@
+"""
+Warning: This file is not tested, use at your own risk.
+
+ICP-10111 Pressure Event Detector - MicroPython
+===============================================
+
+Turns the pressure stream into a few records worth transmitting instead
+of every sample:
+
+- Step changes (doors, floor changes): two-sided CUSUM of the pressure
+  against a slow baseline that follows the current trend. Steps of
+  step_pa or more are detected within a few samples; noise alone
+  practically never reaches the threshold.
+- Trends (weather fronts): slope of an exponentially weighted linear
+  regression (time constant trend_tau_s) of the step-compensated
+  pressure; an event is raised when |slope| exceeds trend_pa_h and
+  cleared below half of it.
+- Summaries: count, mean, min, max and standard deviation of each
+  summary period plus the current trend.
+
+All state is a fixed set of scalars, so memory use does not depend on
+the sampling rate or the time constants. Timestamps can arrive at
+irregular intervals (e.g. from icp10111_adaptive).
+
+    detector = EventDetector(step_pa=6, trend_pa_h=100)
+    for record in detector.update(timestamp_ms, pressure_pa):
+        radio.send(pack_record(record))
+
+Records are tuples (kind, timestamp ms, value, extra):
+- EVENT_STEP:        pressure change Pa, baseline before the step Pa
+- EVENT_TREND_START: slope Pa/h, pressure Pa
+- EVENT_TREND_END:   slope Pa/h, pressure Pa
+- EVENT_SUMMARY:     mean Pa, standard deviation Pa (count, min, max and
+                     slope are in EventDetector.last_summary)
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import math
+import struct
+import time
+
+from icp10111 import ICP10111, ticks_ms, ticks_diff, ticks_add
+
+EVENT_STEP = 1
+EVENT_TREND_START = 2
+EVENT_TREND_END = 3
+EVENT_SUMMARY = 4
+
+EVENT_NAMES = {
+    EVENT_STEP: "step",
+    EVENT_TREND_START: "trend start",
+    EVENT_TREND_END: "trend end",
+    EVENT_SUMMARY: "summary",
+}
+
+# kind (u8), timestamp ms (u32), value (f32), extra (f32): 13 bytes
+RECORD_FORMAT = '<BIff'
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+
+def pack_record(record):
+    """Compact binary form of a record for a radio or serial link"""
+    kind, timestamp, value, extra = record
+    return struct.pack(RECORD_FORMAT, kind, timestamp & 0xFFFFFFFF,
+                       value, extra)
+
+
+def unpack_record(data):
+    return struct.unpack(RECORD_FORMAT, data)
+
+
+class TrendEstimator:
+    """Slope of an exponentially weighted linear regression
+
+    Keeps the weighted sums S0, St, Stt, Sp, Stp with the time origin at
+    the newest sample: advancing by dt shifts the origin and decays every
+    weight by exp(-dt / tau). Pressures are taken relative to the first
+    sample to keep single-precision floats accurate.
+    """
+
+    def __init__(self, tau_s=300.0):
+        self.tau_s = tau_s
+        self.reset()
+
+    def reset(self):
+        self._s0 = 0.0
+        self._st = 0.0
+        self._stt = 0.0
+        self._sp = 0.0
+        self._stp = 0.0
+        self._origin = None
+        self.slope = 0.0  # Pa/s
+
+    def update(self, dt_s, pressure):
+        if self._origin is None:
+            self._origin = pressure
+        p = pressure - self._origin
+        if dt_s > 0:
+            # Move the time origin to the new sample (older samples at t < 0)
+            st = self._st
+            self._stt += dt_s * (dt_s * self._s0 - 2 * st)
+            self._stp -= dt_s * self._sp
+            self._st = st - dt_s * self._s0
+            w = math.exp(-dt_s / self.tau_s)
+            self._s0 *= w
+            self._st *= w
+            self._stt *= w
+            self._sp *= w
+            self._stp *= w
+        self._s0 += 1.0
+        self._sp += p
+        det = self._s0 * self._stt - self._st * self._st
+        if det > 1e-6 * self._s0 * self._stt:
+            self.slope = (self._s0 * self._stp - self._st * self._sp) / det
+        return self.slope
+
+
+class EventDetector:
+    """Step, trend and summary records from pressure samples"""
+
+    def __init__(self, step_pa=6.0, cusum_h=None, baseline_tau_s=60.0,
+                 settle_s=20.0, trend_pa_h=100.0, trend_tau_s=300.0,
+                 summary_s=600.0, warmup_s=None):
+        """
+        step_pa:        smallest step to detect (CUSUM drift k = step_pa / 2)
+        cusum_h:        CUSUM decision threshold in Pa (default step_pa)
+        baseline_tau_s: time constant of the reference level
+        settle_s:       time after a step during which the new level is
+                        tracked quickly and no further step is reported
+        trend_pa_h:     slope that starts a trend event (Pa per hour)
+        trend_tau_s:    time constant of the trend regression
+        summary_s:      interval between summary records (0 disables them)
+        warmup_s:       time before trend events are allowed
+                        (default trend_tau_s)
+        """
+        self.k = step_pa / 2
+        self.h = step_pa if cusum_h is None else cusum_h
+        self.baseline_tau_s = baseline_tau_s
+        self.settle_ms = int(settle_s * 1000)
+        self.trend_pa_s = trend_pa_h / 3600
+        self.summary_ms = int(summary_s * 1000)
+        if warmup_s is None:
+            warmup_s = trend_tau_s
+        self.warmup_ms = int(warmup_s * 1000)
+        self.trend = TrendEstimator(trend_tau_s)
+        self.reset()
+
+    def reset(self):
+        self.trend.reset()
+        self.baseline = None
+        self.in_trend = False
+        self.samples = 0
+        self.records = 0
+        self.last_summary = None
+        self._g_up = 0.0
+        self._g_down = 0.0
+        self._last_ms = None
+        self._start_ms = None
+        self._settle_until = None
+        self._step_from = 0.0
+        self._offset = 0.0
+        self._trend_dt = 0.0
+        self._reset_period(None)
+
+    def _reset_period(self, timestamp):
+        self._period_start = timestamp
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = 0.0
+        self._max = 0.0
+
+    @property
+    def trend_pa_h(self):
+        return self.trend.slope * 3600
+
+    def _trend_ready(self, timestamp_ms):
+        return ticks_diff(timestamp_ms, self._start_ms) >= self.warmup_ms
+
+    def update(self, timestamp_ms, pressure):
+        """Feed one sample (Pa); returns the records it produced (often ())"""
+        self.samples += 1
+        records = ()
+        if self._last_ms is None:
+            self.baseline = pressure
+            self._start_ms = timestamp_ms
+            self._period_start = timestamp_ms
+            dt = 0.0
+        else:
+            dt = ticks_diff(timestamp_ms, self._last_ms) / 1000
+        self._last_ms = timestamp_ms
+
+        # Summary statistics of the current period (Welford)
+        n = self._n + 1
+        self._n = n
+        delta = pressure - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (pressure - self._mean)
+        if n == 1 or pressure < self._min:
+            self._min = pressure
+        if n == 1 or pressure > self._max:
+            self._max = pressure
+
+        settling = self._settle_until is not None
+        if settling:
+            # Follow the new level quickly while the step completes
+            self.baseline += 0.3 * (pressure - self.baseline)
+            if ticks_diff(timestamp_ms, self._settle_until) >= 0:
+                # Remove the finished step from the trend input
+                self._offset += self.baseline - self._step_from
+                self._settle_until = None
+        else:
+            if self._trend_ready(timestamp_ms):
+                # Let the baseline follow the trend so a front does not lag it
+                self.baseline += self.trend.slope * dt
+            residual = pressure - self.baseline
+            self._g_up = max(0.0, self._g_up + residual - self.k)
+            self._g_down = max(0.0, self._g_down - residual - self.k)
+            if self._g_up > self.h or self._g_down > self.h:
+                records = ((EVENT_STEP, timestamp_ms, residual,
+                            self.baseline),)
+                self._step_from = self.baseline
+                self.baseline = pressure
+                self._g_up = 0.0
+                self._g_down = 0.0
+                self._settle_until = ticks_add(timestamp_ms, self.settle_ms)
+            elif dt > 0:
+                self.baseline += residual * dt / (self.baseline_tau_s + dt)
+
+        # Trend of the step-compensated pressure (skipped during steps)
+        self._trend_dt += dt
+        if not settling and self._settle_until is None:
+            slope = self.trend.update(self._trend_dt, pressure - self._offset)
+            self._trend_dt = 0.0
+            if self._trend_ready(timestamp_ms):
+                if not self.in_trend and abs(slope) > self.trend_pa_s:
+                    self.in_trend = True
+                    records += ((EVENT_TREND_START, timestamp_ms,
+                                 slope * 3600, pressure),)
+                elif self.in_trend and abs(slope) < self.trend_pa_s / 2:
+                    self.in_trend = False
+                    records += ((EVENT_TREND_END, timestamp_ms,
+                                 slope * 3600, pressure),)
+
+        if (self.summary_ms and ticks_diff(timestamp_ms, self._period_start)
+                >= self.summary_ms):
+            records += (self._summary(timestamp_ms),)
+
+        self.records += len(records)
+        return records
+
+    def _summary(self, timestamp_ms):
+        n = self._n
+        std = math.sqrt(self._m2 / (n - 1)) if n > 1 else 0.0
+        self.last_summary = (n, self._mean, self._min, self._max, std,
+                             self.trend_pa_h)
+        record = (EVENT_SUMMARY, timestamp_ms, self._mean, std)
+        self._reset_period(timestamp_ms)
+        return record
+
+
+class PressureEventMonitor:
+    """Reads an ICP10111 and passes only detector records to send()"""
+
+    def __init__(self, sensor, send, detector=None):
+        self.sensor = sensor
+        self.send = send
+        self.detector = detector or EventDetector()
+
+    def poll(self):
+        """Take one reading; returns the number of records sent"""
+        temperature, pressure = self.sensor.read_sensor_data()
+        records = self.detector.update(ticks_ms(), pressure * 100)
+        for record in records:
+            self.send(record)
+        return len(records)
+
+
+def main():
+    """Detect events at 1 Hz and print only the records"""
+    from machine import Pin, I2C
+
+    i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=400000)
+    sensor = ICP10111(i2c, mode=ICP10111.MODE_NORMAL)
+
+    def send(record):
+        kind, timestamp, value, extra = record
+        print(f"{timestamp:10d} ms  {EVENT_NAMES[kind]:11s} "
+              f"{value:10.2f} {extra:10.2f}")
+
+    monitor = PressureEventMonitor(sensor, send)
+    try:
+        while True:
+            monitor.poll()
+            time.sleep(1)
+    except KeyboardInterrupt:
+        detector = monitor.detector
+        print(f"\n{detector.records} records for {detector.samples} samples")
+
+
+if __name__ == "__main__":
+    main()
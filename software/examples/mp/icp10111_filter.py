@@ -0,0 +1,161 @@
+"""
+ICP-10111 Pressure Filters - MicroPython
+========================================
+
+Fixed-window digital filters for smoothing pressure readings without
+allocating per sample, and a FilteredICP10111 wrapper that exposes the
+raw and filtered pressure side by side.
+
+Filters (all with update(x) -> filtered value):
+- MovingAverage(n):  O(1) per sample, delay (n - 1) / 2 samples,
+                     noise / sqrt(n)
+- EMA(alpha):        O(1) per sample, delay (1 - alpha) / alpha samples,
+                     noise * sqrt(alpha / (2 - alpha))
+- MedianFilter(n):   O(n) per sample, delay (n - 1) / 2 samples,
+                     noise ~ 1.25 / sqrt(n), rejects isolated spikes
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+from array import array
+
+
+class MovingAverage:
+    """Mean of the last n samples using a running sum"""
+
+    def __init__(self, n):
+        self.n = n
+        self._window = array('f', [0.0] * n)
+        self.reset()
+
+    def reset(self):
+        self._index = 0
+        self._count = 0
+        self._sum = 0.0
+        self.value = None
+
+    def update(self, x):
+        i = self._index
+        if self._count < self.n:
+            self._count += 1
+        else:
+            self._sum -= self._window[i]
+        self._window[i] = x
+        self._sum += x
+
+        i += 1
+        if i == self.n:
+            i = 0
+            # Resync once per window so rounding errors cannot accumulate
+            self._sum = sum(self._window)
+        self._index = i
+
+        self.value = self._sum / self._count
+        return self.value
+
+
+class EMA:
+    """Exponential moving average, y += alpha * (x - y)"""
+
+    def __init__(self, alpha):
+        self.alpha = alpha
+        self.reset()
+
+    def reset(self):
+        self.value = None
+
+    def update(self, x):
+        if self.value is None:
+            self.value = x
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+
+class MedianFilter:
+    """Median of the last n samples
+
+    Keeps the window in arrival order and a sorted copy; each sample
+    removes the oldest value from the sorted copy and inserts the new one
+    in place, so nothing is allocated.
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self._window = array('f', [0.0] * n)
+        self._sorted = array('f', [0.0] * n)
+        self.reset()
+
+    def reset(self):
+        self._index = 0
+        self._count = 0
+        self.value = None
+
+    def update(self, x):
+        s = self._sorted
+        count = self._count
+
+        if count == self.n:
+            # Remove the oldest sample from the sorted copy
+            old = self._window[self._index]
+            j = 0
+            while s[j] != old:
+                j += 1
+            while j < count - 1:
+                s[j] = s[j + 1]
+                j += 1
+            count -= 1
+
+        # Insert the new sample keeping the copy sorted
+        j = count
+        while j > 0 and s[j - 1] > x:
+            s[j] = s[j - 1]
+            j -= 1
+        s[j] = x
+        count += 1
+        self._count = count
+
+        # Store through the array so old values compare equal later
+        self._window[self._index] = x
+        self._index += 1
+        if self._index == self.n:
+            self._index = 0
+
+        mid = count >> 1
+        if count & 1:
+            self.value = s[mid]
+        else:
+            self.value = (s[mid - 1] + s[mid]) / 2
+        return self.value
+
+
+class FilteredICP10111:
+    """ICP10111 readings with a filtered pressure next to the raw one"""
+
+    def __init__(self, sensor, pressure_filter):
+        self.sensor = sensor
+        self.filter = pressure_filter
+        self.temperature = 0.0
+        self.pressure = 0.0
+        self.filtered_pressure = 0.0
+
+        # Reusable [temperature °C, pressure hPa, filtered pressure hPa]
+        self._result = array('f', (0.0, 0.0, 0.0))
+
+    def update(self, temperature, pressure):
+        """Feed one reading (°C, hPa) taken elsewhere"""
+        self.temperature = temperature
+        self.pressure = pressure
+        self.filtered_pressure = self.filter.update(pressure)
+
+    def read(self, out=None):
+        """Measure and return [temperature, pressure, filtered pressure]"""
+        if out is None:
+            out = self._result
+        reading = self.sensor.read()
+        self.update(reading[0], reading[1])
+        out[0] = self.temperature
+        out[1] = self.pressure
+        out[2] = self.filtered_pressure
+        return out
@@ -0,0 +1,101 @@
+"""
+ICP-10111 Altitude / Vertical Speed Estimator - MicroPython / Python
+====================================================================
+
+Two-state Kalman filter (altitude, vertical velocity) fed with pressure
+samples at irregular timestamps. The 2x2 covariance is kept in three
+scalars, so an update is a fixed handful of multiply/adds with no lists
+or matrices. Pure Python: runs on the board and on a desktop over
+logged data.
+
+    kf = AltitudeKalman(reference_pressure=101325)
+    altitude, velocity = kf.update(timestamp_ms, pressure_pa)
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+try:
+    from time import ticks_diff
+except ImportError:
+    # CPython: timestamps do not wrap
+    def ticks_diff(end, start):
+        return end - start
+
+
+def barometric_altitude(pressure, reference_pressure=101325):
+    """Altitude in meters (same formula as ICP10111.calculate_altitude)"""
+    return 44330 * (1 - pow(pressure / reference_pressure, 0.1903))
+
+
+class AltitudeKalman:
+    """Constant-velocity Kalman filter for altitude and climb rate"""
+
+    def __init__(self, reference_pressure=101325, pressure_noise=0.8,
+                 accel_noise=0.5, altitude_func=None):
+        """
+        pressure_noise: RMS noise of the pressure input in Pa
+        accel_noise:    RMS vertical acceleration the model allows (m/s^2)
+        altitude_func:  pressure (Pa) -> altitude (m), e.g. the driver's
+                        fast_altitude; defaults to the exact formula
+        """
+        self.reference_pressure = reference_pressure
+        self.altitude_func = altitude_func
+
+        # About 0.084 m of altitude per Pa near sea level
+        self.r = (pressure_noise * 0.084) ** 2
+        self.q = accel_noise * accel_noise
+        self.reset()
+
+    def reset(self):
+        self.altitude = 0.0
+        self.velocity = 0.0
+        self._p00 = 0.0
+        self._p01 = 0.0
+        self._p11 = 0.0
+        self._last_ms = None
+
+    def _altitude(self, pressure):
+        if self.altitude_func is not None:
+            return self.altitude_func(pressure)
+        return barometric_altitude(pressure, self.reference_pressure)
+
+    def update(self, timestamp_ms, pressure):
+        """Fold in one pressure sample and return (altitude m, velocity m/s)"""
+        z = self._altitude(pressure)
+
+        if self._last_ms is None:
+            # First sample: start at the measurement, velocity unknown
+            self.altitude = z
+            self.velocity = 0.0
+            self._p00 = self.r
+            self._p01 = 0.0
+            self._p11 = 100.0
+            self._last_ms = timestamp_ms
+            return self.altitude, self.velocity
+
+        dt = ticks_diff(timestamp_ms, self._last_ms) / 1000
+        self._last_ms = timestamp_ms
+
+        # Predict
+        if dt > 0:
+            q = self.q
+            dt2 = dt * dt
+            self.altitude += self.velocity * dt
+            self._p00 += dt * (2 * self._p01 + dt * self._p11) + q * dt2 * dt2 / 4
+            self._p01 += dt * self._p11 + q * dt2 * dt / 2
+            self._p11 += q * dt2
+
+        # Correct
+        p00 = self._p00
+        p01 = self._p01
+        s = p00 + self.r
+        k0 = p00 / s
+        k1 = p01 / s
+        y = z - self.altitude
+        self.altitude += k0 * y
+        self.velocity += k1 * y
+        self._p11 -= k1 * p01
+        self._p00 = p00 - k0 * p00
+        self._p01 = p01 - k0 * p01
+        return self.altitude, self.velocity
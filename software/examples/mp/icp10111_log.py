@@ -0,0 +1,125 @@
+"""
+Warning: This file is not tested, use at your own risk.
+
+ICP-10111 Binary Logger - MicroPython
+=====================================
+
+Stores readings as fixed-width binary records instead of formatted text.
+Records are packed with struct into a preallocated block and the block
+is written to flash in one call when it fills up.
+
+File layout (little-endian):
+- 32-byte header: magic b'ICPL', version, record size, the four OTP
+  calibration constants, reserved bytes
+- N records of 20 bytes: timestamp ms (u32), raw pressure (u32),
+  raw temperature (u16), padding, temperature °C (f32), pressure Pa (f32)
+
+Because the OTP constants are in the header, the raw words can be
+re-converted later (see software/host/icp10111_logreader.py).
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import struct
+import time
+
+from icp10111 import ICP10111, ticks_ms
+
+LOG_MAGIC = b'ICPL'
+LOG_VERSION = 1
+
+HEADER_FORMAT = '<4sHH4h16x'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+RECORD_FORMAT = '<IIHxxff'
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+
+def pack_header(otp):
+    return struct.pack(HEADER_FORMAT, LOG_MAGIC, LOG_VERSION, RECORD_SIZE, *otp)
+
+
+def unpack_header(data):
+    """Return the OTP constants stored in a header"""
+    magic, version, record_size, c0, c1, c2, c3 = struct.unpack(HEADER_FORMAT, data)
+    if magic != LOG_MAGIC or version != LOG_VERSION or record_size != RECORD_SIZE:
+        raise ValueError("Not an ICP-10111 log file")
+    return (c0, c1, c2, c3)
+
+
+class BinaryLogger:
+    """Buffered fixed-width record logger"""
+
+    def __init__(self, path, otp, block_records=64):
+        """Open (or append to) a log file for a sensor with these OTP constants"""
+        self.otp = tuple(otp)
+        self.block_records = block_records
+        self.records = 0
+        self._block = bytearray(RECORD_SIZE * block_records)
+        self._view = memoryview(self._block)
+        self._count = 0
+
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(HEADER_SIZE)
+        except OSError:
+            header = b''
+
+        if header:
+            # Appending only makes sense for the same sensor
+            if unpack_header(header) != self.otp:
+                raise ValueError("Log file belongs to a different sensor")
+            self._file = open(path, 'ab')
+        else:
+            self._file = open(path, 'wb')
+            self._file.write(pack_header(self.otp))
+
+    def log(self, timestamp, raw_t, raw_p, temperature, pressure):
+        """Append one record (pressure in Pa); flushes when the block is full"""
+        struct.pack_into(RECORD_FORMAT, self._block, self._count * RECORD_SIZE,
+                         timestamp, raw_p, raw_t, temperature, pressure)
+        self._count += 1
+        self.records += 1
+        if self._count == self.block_records:
+            self.flush()
+
+    def log_sensor(self, sensor, timestamp=None):
+        """Record the sensor's last collected sample (raw_t/raw_p)"""
+        if timestamp is None:
+            timestamp = ticks_ms()
+        temperature, pressure = sensor.convert(sensor.raw_t, sensor.raw_p)
+        self.log(timestamp, sensor.raw_t, sensor.raw_p, temperature, pressure)
+
+    def flush(self):
+        """Write the buffered records in one call"""
+        if self._count:
+            self._file.write(self._view[:self._count * RECORD_SIZE])
+            self._file.flush()
+            self._count = 0
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+def main():
+    """Log one sample per second to icp10111.log"""
+    from machine import Pin, I2C
+
+    i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=400000)
+    sensor = ICP10111(i2c)
+    logger = BinaryLogger('icp10111.log', sensor.calibration.otp)
+
+    try:
+        while True:
+            sensor.read()
+            logger.log_sensor(sensor)
+            time.sleep(1)
+    except KeyboardInterrupt:
+        logger.close()
+        print(f"\nLogged {logger.records} records")
+
+
+if __name__ == "__main__":
+    main()
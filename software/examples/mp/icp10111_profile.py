@@ -0,0 +1,103 @@
+"""
+ICP-10111 Driver Profiler - MicroPython
+=======================================
+
+Collects per-stage timings from the ICP10111 driver into fixed-bucket
+latency histograms. Attach it only while investigating; without a
+profiler each instrumented driver method costs one attribute check.
+
+    from icp10111_profile import Profiler
+    profiler = Profiler()
+    sensor = ICP10111(i2c, profiler=profiler)  # or sensor.profiler = profiler
+    ...
+    profiler.report()
+
+Stages: init (OTP readout), write (measurement command), wait
+(conversion), read (result frame incl. CRC), convert (raw to °C/Pa),
+altitude.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+from array import array
+
+# Indexed by the STAGE_* constants of icp10111 (STAGE_INIT = 0, ...)
+STAGE_NAMES = ("init", "write", "wait", "read", "convert", "altitude")
+
+# Bucket i counts durations in [2^i, 2^(i+1)) us; the last one is open-ended
+BUCKETS = 21
+
+
+class LatencyHistogram:
+    """Log2-bucketed duration histogram with count, total and maximum"""
+
+    def __init__(self):
+        self.buckets = array('L', [0] * BUCKETS)
+        self.reset()
+
+    def reset(self):
+        for i in range(BUCKETS):
+            self.buckets[i] = 0
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    def add(self, us):
+        self.count += 1
+        self.total_us += us
+        if us > self.max_us:
+            self.max_us = us
+        i = 0
+        while us > 1 and i < BUCKETS - 1:
+            us >>= 1
+            i += 1
+        self.buckets[i] += 1
+
+    def mean_us(self):
+        return self.total_us / self.count if self.count else 0
+
+    def percentile_us(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples"""
+        target = fraction * self.count
+        seen = 0
+        for i in range(BUCKETS):
+            seen += self.buckets[i]
+            if seen >= target and seen:
+                return min(1 << (i + 1), self.max_us)
+        return 0
+
+
+class Profiler:
+    """One LatencyHistogram per driver stage"""
+
+    def __init__(self):
+        self.stages = [LatencyHistogram() for _ in STAGE_NAMES]
+
+    def record(self, stage, us):
+        self.stages[stage].add(us)
+
+    def reset(self):
+        for histogram in self.stages:
+            histogram.reset()
+
+    def stats(self, stage):
+        """Summary of one stage as a dict"""
+        h = self.stages[stage]
+        return {
+            'count': h.count,
+            'mean_us': h.mean_us(),
+            'p50_us': h.percentile_us(0.5),
+            'p99_us': h.percentile_us(0.99),
+            'max_us': h.max_us,
+        }
+
+    def report(self):
+        """Print one line per stage that has samples"""
+        print("Stage    |  Count |  Mean us | p50 us | p99 us |  Max us")
+        for stage, name in enumerate(STAGE_NAMES):
+            h = self.stages[stage]
+            if h.count:
+                print(f"{name:8s} | {h.count:6d} | {h.mean_us():8.1f} | "
+                      f"{h.percentile_us(0.5):6d} | {h.percentile_us(0.99):6d} | "
+                      f"{h.max_us:7d}")
@@ -0,0 +1,88 @@
+"""
+ICP-10111 Warm Start from RTC Memory - MicroPython
+==================================================
+
+The four OTP calibration constants never change, so after the first boot
+they can be cached in RTC user memory, which survives deep sleep. On a
+warm start the driver is built from the cached values and the OTP
+readout (setup write plus four command/read transactions) is skipped.
+
+    from icp10111_rtc import warm_start
+    sensor = warm_start(i2c)   # reads OTP only if the cache is missing
+
+The cache is 12 bytes: magic, the sensor address, the four signed
+16-bit constants and a CRC-8 over them. A bad magic, address or CRC
+falls back to a normal cold start. RTC memory is shared; pass offset if
+the application keeps its own data there.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+from icp10111 import ICP10111, CRC8_TABLE
+
+MAGIC = b'IC'
+CACHE_SIZE = 12
+
+
+def _crc8(data, start, end):
+    crc = 0xFF
+    for i in range(start, end):
+        crc = CRC8_TABLE[crc ^ data[i]]
+    return crc
+
+
+def pack_otp(otp, address=ICP10111.ADDRESS):
+    """Serialise OTP constants into the 12-byte cache format"""
+    buf = bytearray(CACHE_SIZE)
+    buf[0:2] = MAGIC
+    buf[2] = address
+    for i, value in enumerate(otp):
+        value &= 0xFFFF
+        buf[3 + 2 * i] = value >> 8
+        buf[4 + 2 * i] = value & 0xFF
+    buf[11] = _crc8(buf, 2, 11)
+    return buf
+
+
+def unpack_otp(data, address=ICP10111.ADDRESS):
+    """OTP constants from a cache entry, or None if it is not valid"""
+    if len(data) < CACHE_SIZE or data[0:2] != MAGIC or data[2] != address:
+        return None
+    if _crc8(data, 2, 11) != data[11]:
+        return None
+    otp = []
+    for i in range(4):
+        word = (data[3 + 2 * i] << 8) | data[4 + 2 * i]
+        otp.append(word - 0x10000 if word & 0x8000 else word)
+    return otp
+
+
+def save_otp(sensor, offset=0):
+    """Store the sensor's calibration constants in RTC memory"""
+    from machine import RTC
+
+    rtc = RTC()
+    memory = bytearray(rtc.memory())
+    entry = pack_otp(sensor.calibration.otp, sensor.address)
+    if len(memory) < offset + CACHE_SIZE:
+        memory.extend(bytes(offset + CACHE_SIZE - len(memory)))
+    memory[offset:offset + CACHE_SIZE] = entry
+    rtc.memory(memory)
+
+
+def load_otp(address=ICP10111.ADDRESS, offset=0):
+    """Cached calibration constants, or None after a power cycle"""
+    from machine import RTC
+
+    memory = RTC().memory()
+    return unpack_otp(memory[offset:offset + CACHE_SIZE], address)
+
+
+def warm_start(i2c, address=ICP10111.ADDRESS, offset=0, **kwargs):
+    """Create an ICP10111, reusing cached calibration when available"""
+    otp = load_otp(address, offset)
+    sensor = ICP10111(i2c, address, otp=otp, **kwargs)
+    if otp is None:
+        save_otp(sensor, offset)
+    return sensor
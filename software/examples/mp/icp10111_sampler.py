@@ -0,0 +1,221 @@
+"""
+Warning: This file is not tested, use at your own risk.
+
+ICP-10111 Background Sampler - MicroPython
+==========================================
+
+Samples the ICP-10111 at a fixed rate from a hardware timer or a
+uasyncio task and stores timestamped readings in a preallocated ring
+buffer. The main loop drains the buffer in bulk whenever it has time,
+e.g. between network transfers.
+
+Each tick collects the conversion started on the previous tick and
+immediately starts the next one, so the sampler never waits for the
+sensor.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import time
+from array import array
+
+from icp10111 import ICP10111, ticks_ms, ticks_diff, ticks_add
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+
+class RingBuffer:
+    """Fixed-size buffer of (timestamp ms, temperature °C, pressure Pa)
+
+    Single producer (the sampler) and single consumer (the main loop):
+    only the producer moves the head and only the consumer moves the
+    tail, so draining never has to block the sampler. When the buffer is
+    full new samples are dropped and counted.
+    """
+
+    def __init__(self, capacity):
+        # One slot stays empty to tell a full buffer from an empty one
+        self._size = capacity + 1
+        self.timestamps = array('L', [0] * self._size)
+        self.temperature = array('f', [0.0] * self._size)
+        self.pressure = array('f', [0.0] * self._size)
+        self._head = 0
+        self._tail = 0
+        self.dropped = 0
+
+    @property
+    def capacity(self):
+        return self._size - 1
+
+    def __len__(self):
+        return (self._head - self._tail) % self._size
+
+    def push(self, timestamp, temperature, pressure):
+        """Store one sample, returning False if it had to be dropped"""
+        head = self._head
+        nxt = head + 1
+        if nxt == self._size:
+            nxt = 0
+        if nxt == self._tail:
+            self.dropped += 1
+            return False
+        self.timestamps[head] = timestamp
+        self.temperature[head] = temperature
+        self.pressure[head] = pressure
+        self._head = nxt
+        return True
+
+    def drain(self, timestamps, temperature, pressure):
+        """Move up to len(timestamps) oldest samples into the given arrays
+
+        Returns the number of samples copied.
+        """
+        tail = self._tail
+        count = min(len(self), len(timestamps))
+        size = self._size
+        for i in range(count):
+            timestamps[i] = self.timestamps[tail]
+            temperature[i] = self.temperature[tail]
+            pressure[i] = self.pressure[tail]
+            tail += 1
+            if tail == size:
+                tail = 0
+        self._tail = tail
+        return count
+
+
+class ICP10111Sampler:
+    """Fixed-rate ICP-10111 sampling into a RingBuffer"""
+
+    def __init__(self, sensor, rate_hz, capacity=256, mode=None):
+        self.sensor = sensor
+        self.period_ms = max(1, int(1000 / rate_hz))
+        self.mode = sensor.mode if mode is None else mode
+        self.buffer = RingBuffer(capacity)
+
+        # Counters
+        self.samples = 0
+        self.overruns = 0
+        self.errors = 0
+
+        self._pending = False
+        self._started_at = 0
+        self._timer = None
+        self._schedule = None
+        self._running = False
+
+        # Bound methods allocate, so create the scheduled callback once
+        self._tick_ref = self.tick
+
+    @property
+    def dropped(self):
+        return self.buffer.dropped
+
+    def tick(self, _=None):
+        """Collect the previous conversion and start the next one"""
+        sensor = self.sensor
+        if self._pending:
+            if not sensor.ready():
+                # Period shorter than the conversion time; try next tick
+                self.overruns += 1
+                return
+            try:
+                sensor.collect_raw()
+            except (RuntimeError, OSError):
+                # Frame still corrupt after the driver's CRC retries, or the
+                # bus failed (NACK); drop the sample and start over below
+                self.errors += 1
+                self._pending = False
+            else:
+                calibration = sensor.calibration
+                self.buffer.push(self._started_at,
+                                 calibration.temperature(sensor.raw_t),
+                                 calibration.pressure(sensor.raw_t, sensor.raw_p))
+                self.samples += 1
+
+        self._started_at = ticks_ms()
+        try:
+            sensor.start_measurement(self.mode)
+        except OSError:
+            # Nothing pending: the next tick starts a new measurement
+            self.errors += 1
+            self._pending = False
+            return
+        self._pending = True
+
+    def _irq(self, _timer):
+        # I2C is not allowed in a hard interrupt, defer to the scheduler
+        try:
+            self._schedule(self._tick_ref, None)
+        except RuntimeError:
+            # Schedule queue full: the previous tick is still waiting
+            self.overruns += 1
+
+    def start_timer(self, timer_id=0):
+        """Sample from a periodic hardware timer"""
+        from machine import Timer
+        from micropython import schedule
+        self._schedule = schedule
+        self._timer = Timer(timer_id)
+        self._timer.init(period=self.period_ms, mode=Timer.PERIODIC,
+                         callback=self._irq)
+
+    async def run(self):
+        """Sample from a uasyncio task until stop() is called"""
+        self._running = True
+        deadline = ticks_ms()
+        while self._running:
+            self.tick()
+            # Schedule against absolute deadlines so the rate does not drift
+            deadline = ticks_add(deadline, self.period_ms)
+            delay = ticks_diff(deadline, ticks_ms())
+            if delay < 0:
+                self.overruns += 1
+                deadline = ticks_ms()
+                delay = 0
+            await asyncio.sleep(delay / 1000)
+
+    def stop(self):
+        """Stop the timer or the uasyncio task"""
+        self._running = False
+        if self._timer is not None:
+            self._timer.deinit()
+            self._timer = None
+
+    def drain(self, timestamps, temperature, pressure):
+        """Bulk-copy buffered samples, see RingBuffer.drain"""
+        return self.buffer.drain(timestamps, temperature, pressure)
+
+
+def main():
+    """Sample at 10 Hz in the background and print one block per second"""
+    from machine import Pin, I2C
+
+    i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=400000)
+    sensor = ICP10111(i2c)
+    sampler = ICP10111Sampler(sensor, rate_hz=10, capacity=64)
+    sampler.start_timer()
+
+    timestamps = array('L', [0] * 64)
+    temperature = array('f', [0.0] * 64)
+    pressure = array('f', [0.0] * 64)
+
+    try:
+        while True:
+            time.sleep(1)  # Networking or other work goes here
+            count = sampler.drain(timestamps, temperature, pressure)
+            for i in range(count):
+                print(f"{timestamps[i]:10d} | {temperature[i]:7.2f} | {pressure[i]:10.1f}")
+            print(f"samples={sampler.samples} dropped={sampler.dropped} "
+                  f"overruns={sampler.overruns} errors={sampler.errors}")
+    except KeyboardInterrupt:
+        sampler.stop()
+        print("\nSampling stopped by user")
+
+
+if __name__ == "__main__":
+    main()
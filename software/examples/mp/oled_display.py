@@ -31,7 +31,94 @@ Author: UNIT Electronics
 import time
 from machine import Pin, I2C
 import ssd1306
-from icp10111_basic import ICP10111  # Import our sensor class
+from icp10111 import ICP10111  # Import our sensor class
+
+# SSD1306 addressing commands
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+
+class LineDisplay:
+    """Text lines on an SSD1306 that only redraws and sends what changed
+    
+    Each 8-pixel text line is exactly one SSD1306 page. The last string
+    drawn on each line is cached; set_line() redraws a line only when its
+    text changes, and show() sends only the changed pages (adjacent pages
+    in one transfer) instead of the whole 1 KB framebuffer.
+    
+    On I2C the six addressing commands of each transfer go out as one
+    command stream (control byte 0x00) instead of one transaction per
+    command, so a changed line costs two bus transactions instead of seven.
+    """
+    
+    def __init__(self, oled):
+        self.oled = oled
+        self.pages = oled.height // 8
+        self._text = [None] * self.pages
+        self._dirty = 0  # Bit per page
+        
+        # Same column window as the driver's show() (narrow panels are centred)
+        self._col_start = (128 - oled.width) // 2
+        self._col_end = self._col_start + oled.width - 1
+        
+        # Zero-copy views of each page in the framebuffer
+        self._buffer = memoryview(oled.buffer)
+        
+        # Reusable command stream: Co=0, D/C=0, then the addressing commands
+        self._i2c = getattr(oled, 'i2c', None)
+        self._cmd = bytearray((0x00, SET_COL_ADDR, self._col_start, self._col_end,
+                               SET_PAGE_ADDR, 0, 0))
+    
+    def set_line(self, index, text):
+        """Draw text on a line if it differs from what is shown"""
+        if text == self._text[index]:
+            return
+        self._text[index] = text
+        y = index * 8
+        self.oled.fill_rect(0, y, self.oled.width, 8, 0)
+        self.oled.text(text, 0, y)
+        self._dirty |= 1 << index
+    
+    def set_lines(self, lines):
+        """Set every line from a list (missing lines are blanked)"""
+        for i in range(self.pages):
+            self.set_line(i, lines[i] if i < len(lines) else "")
+    
+    def clear(self):
+        """Blank the whole display on the next show()"""
+        self.oled.fill(0)
+        self._text = [""] * self.pages
+        self._dirty = (1 << self.pages) - 1
+    
+    def show(self):
+        """Send the changed pages to the display"""
+        dirty = self._dirty
+        page = 0
+        width = self.oled.width
+        while dirty:
+            if not dirty & 1:
+                dirty >>= 1
+                page += 1
+                continue
+            # Extend over a run of adjacent dirty pages
+            end = page
+            while dirty & 2:
+                dirty >>= 1
+                end += 1
+            dirty >>= 1
+            if self._i2c is not None:
+                self._cmd[5] = page
+                self._cmd[6] = end
+                self._i2c.writeto(self.oled.addr, self._cmd)
+            else:
+                self.oled.write_cmd(SET_COL_ADDR)
+                self.oled.write_cmd(self._col_start)
+                self.oled.write_cmd(self._col_end)
+                self.oled.write_cmd(SET_PAGE_ADDR)
+                self.oled.write_cmd(page)
+                self.oled.write_cmd(end)
+            self.oled.write_data(self._buffer[page * width:(end + 1) * width])
+            page = end + 1
+        self._dirty = 0
 
 def format_display_text(temp, pressure, altitude):
     """Format sensor data for OLED display"""
@@ -61,9 +148,10 @@ def main():
     try:
         # Initialize OLED display (128x64)
         oled = ssd1306.SSD1306_I2C(128, 64, i2c)
-        oled.fill(0)
-        oled.text("Initializing...", 0, 0)
-        oled.show()
+        display = LineDisplay(oled)
+        display.clear()
+        display.set_line(0, "Initializing...")
+        display.show()
         
         # Initialize pressure sensor
         sensor = ICP10111(i2c)
@@ -79,18 +167,11 @@ def main():
             try:
                 # Read sensor
                 temperature, pressure = sensor.read_sensor_data()
-                altitude = sensor.calculate_altitude(pressure * 100, sensor.reference_pressure)
-                
-                # Clear display
-                oled.fill(0)
-                
-                # Format and display text
-                lines = format_display_text(temperature, pressure, altitude)
-                for i, line in enumerate(lines):
-                    oled.text(line, 0, i * 8)
+                altitude = sensor.fast_altitude(pressure * 100)
                 
-                # Update display
-                oled.show()
+                # Redraw and send only the lines that changed
+                display.set_lines(format_display_text(temperature, pressure, altitude))
+                display.show()
                 
                 # Console output
                 print(f"T:{temperature:.1f}C P:{pressure:.0f}hPa A:{altitude:.1f}m")
@@ -99,15 +180,15 @@ def main():
                 
             except KeyboardInterrupt:
                 print("\nDisplay stopped")
-                oled.fill(0)
-                oled.text("Stopped", 0, 0)
-                oled.show()
+                display.clear()
+                display.set_line(0, "Stopped")
+                display.show()
                 break
             except Exception as e:
                 print(f"Display error: {e}")
-                oled.fill(0)
-                oled.text("Error!", 0, 0)
-                oled.show()
+                display.clear()
+                display.set_line(0, "Error!")
+                display.show()
                 time.sleep(3)
     
     except Exception as e:
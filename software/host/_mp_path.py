@@ -0,0 +1,12 @@
+"""
+Make the MicroPython driver modules in software/examples/mp importable
+from host-side scripts, so both sides share one copy of the sensor math.
+"""
+
+import sys
+from pathlib import Path
+
+MP_DIR = Path(__file__).resolve().parent.parent / "examples" / "mp"
+
+if str(MP_DIR) not in sys.path:
+    sys.path.insert(0, str(MP_DIR))
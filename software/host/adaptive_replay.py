@@ -0,0 +1,100 @@
+"""
+ICP-10111 Adaptive Sampling Replay
+==================================
+
+Replays a pressure trace through AdaptiveRate (the decision logic of
+examples/mp/icp10111_adaptive.py) and compares the estimated sensor
+current with fixed 1 Hz normal-mode sampling.
+
+    python3 adaptive_replay.py               # simulated day with elevator rides
+    python3 adaptive_replay.py trace.csv     # columns: time (s), pressure (Pa)
+
+The trace is linearly interpolated at the times the policy asks for, and
+the datasheet RMS noise of the chosen mode is added to each sample.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import csv
+import random
+import sys
+
+import _mp_path  # noqa: F401
+from fakebus import NOISE_PA
+from icp10111_adaptive import AdaptiveRate, MODE_CHARGE_UC
+
+MODE_NAMES = ("LP", "N", "LN", "ULN")
+FIXED_MODE = 1  # Normal mode at 1 Hz, as in icp10111_basic.main()
+
+
+def load_trace(path):
+    with open(path, newline='') as f:
+        rows = [(float(r['time']), float(r['pressure'])) for r in csv.DictReader(f)]
+    return rows
+
+
+def simulate_trace(hours=8):
+    """Slow weather drift plus a 3-floor elevator ride every 30 minutes"""
+    trace = []
+    for second in range(0, hours * 3600 + 1):
+        p = 101325.0 - 0.0002 * second
+        phase = second % 1800
+        if 600 <= phase < 620:
+            p -= 36.0 * (phase - 600) / 20   # Going up ~3 m
+        elif 620 <= phase < 1200:
+            p -= 36.0
+        elif 1200 <= phase < 1220:
+            p -= 36.0 * (1220 - phase) / 20  # Coming back down
+        trace.append((float(second), p))
+    return trace
+
+
+def interpolate(trace, t, index):
+    """Pressure at time t, advancing index through the sorted trace"""
+    while index + 1 < len(trace) and trace[index + 1][0] <= t:
+        index += 1
+    if index + 1 == len(trace):
+        return trace[index][1], index
+    (t0, p0), (t1, p1) = trace[index], trace[index + 1]
+    return p0 + (p1 - p0) * (t - t0) / (t1 - t0), index
+
+
+def replay(trace, policy, rng):
+    start, end = trace[0][0], trace[-1][0]
+    t = start
+    index = 0
+    charge = 0.0
+    counts = [0, 0, 0, 0]
+    while t <= end:
+        mode = policy.mode
+        pressure, index = interpolate(trace, t, index)
+        pressure += rng.gauss(0.0, NOISE_PA[mode])
+        counts[mode] += 1
+        charge += MODE_CHARGE_UC[mode]
+        t += policy.update(int((t - start) * 1000), pressure) / 1000
+    return charge / (end - start), counts
+
+
+def main():
+    if len(sys.argv) > 1:
+        trace = load_trace(sys.argv[1])
+        source = sys.argv[1]
+    else:
+        trace = simulate_trace()
+        source = "simulated"
+
+    duration = trace[-1][0] - trace[0][0]
+    current, counts = replay(trace, AdaptiveRate(), random.Random(10111))
+    fixed = MODE_CHARGE_UC[FIXED_MODE]
+
+    print(f"Trace: {duration / 3600:.1f} h ({source})")
+    print("Samples per mode: " +
+          ", ".join(f"{name} {n}" for name, n in zip(MODE_NAMES, counts)))
+    print(f"Adaptive:       {current:6.3f} uA average")
+    print(f"Fixed 1 Hz N:   {fixed:6.3f} uA average")
+    print(f"Saving:         {100 * (1 - current / fixed):6.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+ICP-10111 Allocation Benchmark
+==============================
+
+Measures heap allocation per sample for the ICP10111 read paths on a
+fake I2C bus.
+
+Run it on the MicroPython unix port for numbers that match the board:
+
+    MICROPYPATH=.:../examples/mp micropython bench_alloc.py
+
+CPython frees temporaries immediately and has no allocation counter, so
+there the script keeps every result alive and reports the growth of
+sys.getallocatedblocks() per call as "retained blocks/sample": the
+objects each read leaves behind for its result (a tuple and two floats
+for read_sensor_data(), none for read()). Temporaries freed inside the
+call are not included, so these figures are not comparable with the
+gc.mem_alloc() bytes reported on MicroPython.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import gc
+import sys
+
+try:
+    import _mp_path  # noqa: F401
+except ImportError:
+    pass  # MicroPython: modules come from MICROPYPATH
+
+from fakebus import FakeI2C, FakeICP10111
+from icp10111 import ICP10111
+
+SAMPLES = 1000
+
+
+def _make_sensor():
+    i2c = FakeI2C({ICP10111.ADDRESS: FakeICP10111()})
+    # Low-power mode keeps the fake conversion wait short
+    return ICP10111(i2c, mode=ICP10111.MODE_LOW_POWER)
+
+
+def _measure_micropython(func, samples=SAMPLES):
+    """Bytes allocated per call using the MicroPython GC counters"""
+    gc.collect()
+    gc.disable()
+    start = gc.mem_alloc()
+    for _ in range(samples):
+        func()
+    used = gc.mem_alloc() - start
+    gc.enable()
+    return used / samples
+
+
+def _measure_cpython(func, samples=SAMPLES):
+    """Heap blocks still allocated after each call under CPython"""
+    results = [None] * samples
+    gc.collect()
+    gc.disable()
+    start = sys.getallocatedblocks()
+    for i in range(samples):
+        results[i] = func()  # Keep results alive so they stay counted
+    used = sys.getallocatedblocks() - start
+    gc.enable()
+    return used / samples
+
+
+def allocation_meter():
+    """Return (measure(func, samples), unit label) for the interpreter"""
+    if hasattr(gc, 'mem_alloc'):
+        return _measure_micropython, "bytes/sample"
+    return _measure_cpython, "retained blocks/sample"
+
+
+def main():
+    sensor = _make_sensor()
+    measure, unit = allocation_meter()
+
+    print("ICP-10111 heap allocation (fake bus)")
+    print("=" * 36)
+    for name, func in (("read_sensor_data()", sensor.read_sensor_data),
+                       ("read()", sensor.read)):
+        func()  # Warm up caches outside the measurement
+        print(f"{name:20s} {measure(func):8.1f} {unit}")
+
+
+if __name__ == "__main__":
+    main()
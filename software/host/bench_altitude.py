@@ -0,0 +1,72 @@
+"""
+ICP-10111 Altitude Benchmark
+============================
+
+Compares ICP10111.calculate_altitude (exact barometric formula with
+pow()) against ICP10111.fast_altitude (look-up table) for speed and
+accuracy over the sensor's 30-110 kPa range.
+
+    python3 bench_altitude.py
+    MICROPYPATH=.:../examples/mp micropython bench_altitude.py
+
+The accuracy figures hold everywhere, but the timing only means
+something on the target: a desktop CPU evaluates pow() in hardware and
+the interpreted table lookup is slower there, while on soft-float MCUs
+pow() dominates the cost.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+try:
+    import _mp_path  # noqa: F401
+except ImportError:
+    pass  # MicroPython: modules come from MICROPYPATH
+
+from fakebus import FakeI2C, FakeICP10111
+from icp10111 import ICP10111, ticks_us, ticks_diff
+
+REFERENCE_PA = 101325
+PRESSURES = [30000 + i * 80 for i in range(1001)]  # 30 - 110 kPa
+ROUNDS = 20
+
+
+def _time_per_call_us(func, pressures):
+    start = ticks_us()
+    for _ in range(ROUNDS):
+        for p in pressures:
+            func(p)
+    return ticks_diff(ticks_us(), start) / (ROUNDS * len(pressures))
+
+
+def main():
+    sensor = ICP10111(FakeI2C({ICP10111.ADDRESS: FakeICP10111()}))
+    sensor.set_reference_pressure(REFERENCE_PA)
+
+    def exact(p):
+        return sensor.calculate_altitude(p, REFERENCE_PA)
+
+    fast = sensor.fast_altitude
+
+    max_err = 0.0
+    max_err_near = 0.0
+    for p in PRESSURES:
+        err = abs(fast(p) - exact(p))
+        max_err = max(max_err, err)
+        if 90000 <= p <= 110000:
+            max_err_near = max(max_err_near, err)
+
+    t_exact = _time_per_call_us(exact, PRESSURES)
+    t_fast = _time_per_call_us(fast, PRESSURES)
+
+    print("ICP-10111 altitude: exact vs look-up table")
+    print("=" * 42)
+    print(f"exact (pow):    {t_exact:8.3f} us/call")
+    print(f"fast (table):   {t_fast:8.3f} us/call")
+    print(f"speed-up:       {t_exact / t_fast:8.2f} x")
+    print(f"max error 30-110 kPa: {max_err:.4f} m")
+    print(f"max error 90-110 kPa: {max_err_near:.4f} m")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+ICP-10111 Bus Transaction Benchmark
+===================================
+
+Counts I2C transactions, STARTs and bytes for sensor initialisation and
+per sample, with the OTP readout sent as separate write/read
+transactions and as combined write + repeated START + read transactions
+(ICP10111(combined=...)), and reports the wall time of each on the
+simulated bus (Python call overhead only, no wire time).
+
+combined only changes initialisation, and there it saves STOP/START
+pairs (transactions), not STARTs: a repeated START is still a START. A
+sample costs two transactions and two STARTs in both modes. The
+measurement command starts the conversion and the result can only be
+read once the conversion time has passed (the sensor NACKs earlier
+reads), so the write and the read cannot share a transaction.
+
+    python3 bench_bus.py
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+try:
+    import _mp_path  # noqa: F401
+except ImportError:
+    pass  # MicroPython: modules come from MICROPYPATH
+
+from fakebus import FakeI2C, FakeICP10111
+from icp10111 import ICP10111, ticks_us, ticks_diff
+from icp10111_bus import CountingI2C
+
+INITS = 200
+SAMPLES = 200
+
+
+def counts(bus):
+    return (bus.transactions, bus.starts, bus.tx_bytes, bus.rx_bytes, bus.wire_bytes())
+
+
+def run(combined):
+    bus = CountingI2C(FakeI2C({ICP10111.ADDRESS: FakeICP10111(timing=False)}))
+
+    start = ticks_us()
+    for _ in range(INITS):
+        sensor = ICP10111(bus, mode=ICP10111.MODE_LOW_POWER, combined=combined)
+    init_us = ticks_diff(ticks_us(), start) / INITS
+    init = [c / INITS for c in counts(bus)]
+
+    bus.reset()
+    for _ in range(SAMPLES):
+        sensor.start_measurement()
+        sensor.collect_raw()
+    sample = [c / SAMPLES for c in counts(bus)]
+    return init_us, init, sample
+
+
+def main():
+    print("ICP-10111 I2C transactions (simulated bus)")
+    print("=" * 42)
+    print("Access     | Phase  | Trans | STARTs | Out B | In B | Wire B | Time us")
+    for combined in (False, True):
+        init_us, init, sample = run(combined)
+        name = "combined" if combined else "separate"
+        print(f"{name:10s} | init   | {init[0]:5.1f} | {init[1]:6.1f} | {init[2]:5.1f} | "
+              f"{init[3]:4.1f} | {init[4]:6.1f} | {init_us:7.1f}")
+        print(f"{name:10s} | sample | {sample[0]:5.1f} | {sample[1]:6.1f} | {sample[2]:5.1f} | "
+              f"{sample[3]:4.1f} | {sample[4]:6.1f} |")
+    print("\ncombined saves init transactions only; a sample is always the")
+    print("measure command plus a read after the conversion time (2 STARTs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+ICP-10111 Driver Benchmark
+==========================
+
+Runs every ICP10111 read path against the simulated sensor (with the
+datasheet conversion time of each mode) and reports throughput,
+per-call latency percentiles and heap allocation.
+
+    python3 bench_driver.py            # all modes
+    python3 bench_driver.py 0 1        # low-power and normal only
+
+Add new read paths to read_paths() so regressions show up here.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import sys
+
+try:
+    import _mp_path  # noqa: F401
+except ImportError:
+    pass  # MicroPython: modules come from MICROPYPATH
+
+from bench_alloc import allocation_meter
+from fakebus import FakeI2C, FakeICP10111, FakeTCA9548A
+from icp10111 import ICP10111, ticks_us, ticks_diff
+from icp10111_array import SensorArray, TCA9548A
+
+MODE_NAMES = ("low-power", "normal", "low-noise", "ultra-low-noise")
+
+# Keep each run around one second whatever the mode
+SAMPLES = (400, 120, 40, 10)
+
+ARRAY_CHANNELS = 4
+
+
+def read_paths(mode):
+    """(name, callable) for each read path, set up for one mode"""
+    sensor = ICP10111(FakeI2C({ICP10111.ADDRESS: FakeICP10111()}), mode=mode)
+
+    def split_poll():
+        sensor.start_measurement()
+        while not sensor.ready():
+            pass
+        sensor.collect_raw()
+
+    mux = FakeTCA9548A({ch: {ICP10111.ADDRESS: FakeICP10111()}
+                        for ch in range(ARRAY_CHANNELS)})
+    bus = FakeI2C({TCA9548A.ADDRESS: mux})
+    sensors = SensorArray(bus, TCA9548A(bus), range(ARRAY_CHANNELS), mode=mode)
+
+    return (
+        ("read_sensor_data()", sensor.read_sensor_data),
+        ("read()", sensor.read),
+        ("start/ready/collect_raw", split_poll),
+        (f"SensorArray x{ARRAY_CHANNELS}", sensors.read_all),
+    )
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def run(func, samples):
+    """Return (samples/s, p50, p90, p99 latency in us)"""
+    latencies = []
+    start = ticks_us()
+    for _ in range(samples):
+        t0 = ticks_us()
+        func()
+        latencies.append(ticks_diff(ticks_us(), t0))
+    elapsed = ticks_diff(ticks_us(), start)
+    latencies.sort()
+    return (samples * 1000000 / elapsed,
+            percentile(latencies, 0.50),
+            percentile(latencies, 0.90),
+            percentile(latencies, 0.99))
+
+
+def main():
+    modes = [int(m) for m in sys.argv[1:]] or range(len(MODE_NAMES))
+    measure_alloc, alloc_unit = allocation_meter()
+
+    print("ICP-10111 driver benchmark (simulated sensor)")
+    print(f"Allocation column: {alloc_unit}")
+    print(f"{'Mode':16s} {'Read path':24s} {'Samples/s':>9s} "
+          f"{'p50 us':>8s} {'p90 us':>8s} {'p99 us':>8s} {'Alloc':>8s}")
+    print("-" * 87)
+    for mode in modes:
+        for name, func in read_paths(mode):
+            func()  # Warm up
+            rate, p50, p90, p99 = run(func, SAMPLES[mode])
+            alloc = measure_alloc(func, SAMPLES[mode])
+            print(f"{MODE_NAMES[mode]:16s} {name:24s} {rate:9.1f} "
+                  f"{p50:8d} {p90:8d} {p99:8d} {alloc:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+ICP-10111 Kalman Estimator Benchmark
+====================================
+
+Measures the per-update cost of AltitudeKalman and compares its climb
+rate against naive differencing of consecutive altitudes on a simulated
+flight: hover, climb at 2 m/s, hover, descend at 1 m/s, hover. Samples
+arrive every 100 ms with +/-30 ms jitter and low-noise mode pressure
+noise.
+
+    python3 bench_kalman.py
+    MICROPYPATH=.:../examples/mp micropython bench_kalman.py
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import random
+
+try:
+    import _mp_path  # noqa: F401
+except ImportError:
+    pass  # MicroPython: modules come from MICROPYPATH
+
+from fakebus import gauss
+from icp10111 import ticks_us, ticks_diff
+from icp10111_kalman import AltitudeKalman, barometric_altitude
+
+REFERENCE_PA = 101325.0
+NOISE_PA = 0.8
+
+# (duration s, vertical speed m/s)
+FLIGHT = ((20, 0.0), (30, 2.0), (20, 0.0), (60, -1.0), (20, 0.0))
+
+
+def pressure_at(altitude):
+    """Inverse of the barometric formula"""
+    return REFERENCE_PA * pow(1 - altitude / 44330, 1 / 0.1903)
+
+
+def simulate():
+    """Return [(timestamp ms, pressure Pa, true velocity m/s)]"""
+    samples = []
+    t_ms = 0
+    altitude = 0.0
+    for duration, speed in FLIGHT:
+        end = t_ms + duration * 1000
+        while t_ms < end:
+            step = 70 + int(random.random() * 60)
+            t_ms += step
+            altitude += speed * step / 1000
+            pressure = pressure_at(altitude) + NOISE_PA * gauss()
+            samples.append((t_ms, pressure, speed))
+    return samples
+
+
+def rms(values):
+    return (sum(v * v for v in values) / len(values)) ** 0.5
+
+
+def main():
+    random.seed(10111)
+    samples = simulate()
+
+    kf = AltitudeKalman(REFERENCE_PA, pressure_noise=NOISE_PA)
+    kalman_err = []
+    start = ticks_us()
+    for t_ms, pressure, speed in samples:
+        _, velocity = kf.update(t_ms, pressure)
+        kalman_err.append(velocity - speed)
+    per_update = ticks_diff(ticks_us(), start) / len(samples)
+
+    naive_err = []
+    last = None
+    for t_ms, pressure, speed in samples:
+        altitude = barometric_altitude(pressure, REFERENCE_PA)
+        if last is not None:
+            velocity = (altitude - last[1]) * 1000 / (t_ms - last[0])
+            naive_err.append(velocity - speed)
+        last = (t_ms, altitude)
+
+    # Skip the first seconds while the filter settles
+    settle = 50
+    print("ICP-10111 vertical speed estimation")
+    print("=" * 35)
+    print(f"Samples:              {len(samples)}")
+    print(f"Kalman update cost:   {per_update:.2f} us")
+    print(f"Kalman RMS error:     {rms(kalman_err[settle:]):.3f} m/s")
+    print(f"Differencing RMS err: {rms(naive_err[settle:]):.3f} m/s")
+
+
+if __name__ == "__main__":
+    main()
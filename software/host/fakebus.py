@@ -0,0 +1,232 @@
+"""
+Fake I2C Bus with a Simulated ICP-10111
+=======================================
+
+Minimal stand-in for machine.I2C so the ICP10111 driver can run without
+hardware. Devices can also sit behind a simulated TCA9548A multiplexer.
+The simulated sensor answers the OTP readout and measurement
+commands with properly framed words (value + CRC-8) generated from a
+configurable temperature and pressure. Like the real part it NACKs reads
+until the conversion time of the requested mode has passed, and it can
+add the datasheet RMS pressure noise of each mode. error_rate flips a
+random bit in that fraction of reads to exercise the CRC checks.
+
+Written to run under both CPython and the MicroPython unix port.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+try:
+    import _mp_path  # noqa: F401
+except ImportError:
+    pass  # MicroPython: modules come from MICROPYPATH
+
+import math
+import random
+
+from icp10111_calibration import Calibration, TEMP_OFFSET, TEMP_SCALE
+from icp10111 import ICP10111, ticks_us, ticks_diff, ticks_add
+
+# Plausible OTP constants for a simulated part
+DEFAULT_OTP = (1910, 2200, 1750, 3800)
+
+# Product ID word returned for CMD_READ_ID
+PRODUCT_ID = 0x0008
+
+CMD_READ_ID = 0xEFC8
+CMD_OTP_SETUP = 0xC595
+CMD_OTP_READ = 0xC7F7
+MEASURE_COMMANDS = (0x609C, 0x6825, 0x70DF, 0x7866)
+
+# Per-mode conversion time (us) and RMS pressure noise (Pa), datasheet
+CONVERSION_US = (1800, 6300, 23800, 94500)
+NOISE_PA = ICP10111.MODE_NOISE_PA
+
+ENODEV = 19
+
+
+def crc8(data):
+    """CRC-8 used by the sensor (polynomial 0x31, init 0xFF)"""
+    crc = 0xFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            if crc & 0x80:
+                crc = ((crc << 1) ^ 0x31) & 0xFF
+            else:
+                crc = (crc << 1) & 0xFF
+    return crc
+
+
+def gauss():
+    """Standard normal sample (Box-Muller, random.gauss is not portable)"""
+    u = random.random() or 1e-12
+    return math.sqrt(-2.0 * math.log(u)) * math.cos(2.0 * math.pi * random.random())
+
+
+def frame_word(word):
+    """Encode a 16-bit word as MSB, LSB, CRC"""
+    msb = (word >> 8) & 0xFF
+    lsb = word & 0xFF
+    return bytes((msb, lsb, crc8((msb, lsb))))
+
+
+class FakeICP10111:
+    """Simulated ICP-10111 answering driver commands"""
+
+    def __init__(self, temperature=25.0, pressure=101325.0, otp=DEFAULT_OTP,
+                 noise=False, timing=True, error_rate=0.0):
+        self.otp = tuple(otp)
+        self.noise = noise
+        self.timing = timing
+        self.error_rate = error_rate
+        self.corrupted = 0
+        self._calibration = Calibration(self.otp)
+        self._otp_index = 0
+        self._response = b''
+        self._ready_at = None
+        self.last_command = None
+        self.measurements = 0
+        self.set_conditions(temperature, pressure)
+
+    def set_conditions(self, temperature, pressure):
+        """Set the environment the next measurements will report"""
+        self.temperature = temperature
+        self.pressure = pressure
+        self.raw_t, self.raw_p = self.raw_words(temperature, pressure)
+
+    def raw_words(self, temperature, pressure):
+        """Invert the datasheet conversion to get the raw words"""
+        raw_t = int((temperature - TEMP_OFFSET) / TEMP_SCALE + 0.5)
+        raw_t = min(max(raw_t, 0), 0xFFFF)
+        cal = self._calibration
+        cal._update_coefficients(raw_t)
+        raw_p = int(cal._b / (pressure - cal._a) - cal._c + 0.5)
+        return raw_t, min(max(raw_p, 0), 0xFFFFFF)
+
+    def measurement_frame(self, mode=None):
+        """9-byte result frame for the current conditions"""
+        raw_t, raw_p = self.raw_t, self.raw_p
+        if self.noise and mode is not None:
+            raw_t, raw_p = self.raw_words(
+                self.temperature, self.pressure + NOISE_PA[mode] * gauss())
+        return (frame_word(raw_t) +
+                frame_word(raw_p >> 8) +
+                frame_word((raw_p & 0xFF) << 8))
+
+    def write(self, data):
+        """Handle a command written by the host"""
+        cmd = (data[0] << 8) | data[1]
+        self.last_command = cmd
+        if cmd == CMD_OTP_SETUP:
+            self._otp_index = 0
+            self._response = b''
+        elif cmd == CMD_OTP_READ:
+            self._response = frame_word(self.otp[self._otp_index & 3] & 0xFFFF)
+            self._otp_index += 1
+        elif cmd == CMD_READ_ID:
+            self._response = frame_word(PRODUCT_ID)
+        elif cmd in MEASURE_COMMANDS:
+            mode = MEASURE_COMMANDS.index(cmd)
+            self._response = self.measurement_frame(mode)
+            self.measurements += 1
+            if self.timing:
+                self._ready_at = ticks_add(ticks_us(), CONVERSION_US[mode])
+        else:
+            self._response = b''
+
+    def read(self, nbytes):
+        """Return the bytes the host clocks out"""
+        if self._ready_at is not None:
+            if ticks_diff(self._ready_at, ticks_us()) > 0:
+                # Still converting: the sensor NACKs its address
+                raise OSError(ENODEV)
+            self._ready_at = None
+        data = self._response[:nbytes]
+        data = data + bytes(nbytes - len(data))
+        if self.error_rate and random.random() < self.error_rate:
+            data = bytearray(data)
+            bit = int(random.random() * 8 * nbytes)
+            data[bit >> 3] ^= 1 << (bit & 7)
+            self.corrupted += 1
+        return data
+
+
+class FakeTCA9548A:
+    """Simulated TCA9548A multiplexer with devices on its channels"""
+
+    def __init__(self, channels=None):
+        # {channel: {address: device}}
+        self.channels = dict(channels or {})
+        self.mask = 0
+
+    def add_device(self, channel, address, device):
+        self.channels.setdefault(channel, {})[address] = device
+
+    def write(self, data):
+        self.mask = data[0]
+
+    def read(self, nbytes):
+        return bytes((self.mask,)) + bytes(nbytes - 1)
+
+    def route(self, address):
+        """Device answering at address on the enabled channels, if any"""
+        for channel, devices in self.channels.items():
+            if self.mask & (1 << channel) and address in devices:
+                return devices[address]
+        return None
+
+
+class FakeI2C:
+    """Subset of machine.I2C backed by simulated devices"""
+
+    def __init__(self, devices=None):
+        self.devices = dict(devices or {})
+
+    def add_device(self, address, device):
+        self.devices[address] = device
+
+    def _device(self, address):
+        device = self.devices.get(address)
+        if device is None:
+            # Look behind any multiplexer on the bus
+            for mux in self.devices.values():
+                route = getattr(mux, 'route', None)
+                device = route(address) if route else None
+                if device is not None:
+                    break
+            else:
+                raise OSError(ENODEV)
+        return device
+
+    def scan(self):
+        return sorted(self.devices)
+
+    def writeto(self, address, buf, stop=True):
+        self._device(address).write(buf)
+        return len(buf)
+
+    def readfrom(self, address, nbytes, stop=True):
+        return bytes(self._device(address).read(nbytes))
+
+    def readfrom_into(self, address, buf, stop=True):
+        data = self._device(address).read(len(buf))
+        for i in range(len(buf)):
+            buf[i] = data[i]
+
+    def writevto(self, address, vector, stop=True):
+        data = b''.join(bytes(buf) for buf in vector)
+        self._device(address).write(data)
+        return len(data)
+
+    def writeto_mem(self, address, memaddr, buf, addrsize=8):
+        self.writeto(address, memaddr.to_bytes(addrsize // 8, 'big') + bytes(buf))
+
+    def readfrom_mem(self, address, memaddr, nbytes, addrsize=8):
+        self.writeto(address, memaddr.to_bytes(addrsize // 8, 'big'))
+        return self.readfrom(address, nbytes)
+
+    def readfrom_mem_into(self, address, memaddr, buf, addrsize=8):
+        self.writeto(address, memaddr.to_bytes(addrsize // 8, 'big'))
+        self.readfrom_into(address, buf)
@@ -0,0 +1,103 @@
+"""
+ICP-10111 Filter Latency/Noise Trade-off
+========================================
+
+Runs every filter from icp10111_filter over a pressure trace and
+reports how much noise it removes and how long it takes to follow a
+step change.
+
+    python3 filter_tradeoff.py                 # simulated LN-mode trace
+    python3 filter_tradeoff.py trace.csv       # recorded trace
+
+A recorded trace is a CSV file with a 'pressure' column (Pa) taken while
+the sensor was not moving. Noise is the standard deviation of the
+filtered trace after the window has filled; latency is the number of
+samples the filter needs to reach 90 % of a noise-free step.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import csv
+import random
+import sys
+
+import _mp_path  # noqa: F401
+from icp10111_filter import EMA, MedianFilter, MovingAverage
+
+# Low-noise mode RMS noise from the datasheet
+SIM_NOISE_PA = 0.8
+SIM_SAMPLES = 5000
+SIM_LEVEL_PA = 101325.0
+
+STEP_PA = 12.0  # About 1 m of altitude
+
+FILTERS = (
+    ("none", lambda: None),
+    ("moving average n=4", lambda: MovingAverage(4)),
+    ("moving average n=16", lambda: MovingAverage(16)),
+    ("EMA alpha=0.25", lambda: EMA(0.25)),
+    ("EMA alpha=0.06", lambda: EMA(0.06)),
+    ("median n=5", lambda: MedianFilter(5)),
+    ("median n=15", lambda: MedianFilter(15)),
+)
+
+
+def load_trace(path):
+    with open(path, newline='') as f:
+        return [float(row['pressure']) for row in csv.DictReader(f)]
+
+
+def simulate_trace():
+    rng = random.Random(10111)
+    return [SIM_LEVEL_PA + rng.gauss(0.0, SIM_NOISE_PA) for _ in range(SIM_SAMPLES)]
+
+
+def stdev(values):
+    mean = sum(values) / len(values)
+    return (sum((v - mean) ** 2 for v in values) / (len(values) - 1)) ** 0.5
+
+
+def filtered_noise(make_filter, trace, settle=64):
+    filt = make_filter()
+    if filt is None:
+        return stdev(trace)
+    # Filter the deviation from the first sample; float32 windows would
+    # otherwise quantise a ~1e5 Pa signal to ~0.008 Pa
+    base = trace[0]
+    out = [filt.update(p - base) for p in trace]
+    return stdev(out[settle:])
+
+
+def step_latency(make_filter, limit=1000):
+    filt = make_filter()
+    if filt is None:
+        return 0
+    for _ in range(limit):
+        filt.update(0.0)
+    for n in range(limit):
+        if filt.update(STEP_PA) >= 0.9 * STEP_PA:
+            return n
+    return limit
+
+
+def main():
+    if len(sys.argv) > 1:
+        trace = load_trace(sys.argv[1])
+        source = sys.argv[1]
+    else:
+        trace = simulate_trace()
+        source = f"simulated, {SIM_NOISE_PA} Pa RMS"
+
+    raw_noise = stdev(trace)
+    print(f"Trace: {len(trace)} samples ({source})")
+    print("Filter               | Noise (Pa) | Reduction | t90 (samples)")
+    print("-" * 62)
+    for name, make_filter in FILTERS:
+        noise = filtered_noise(make_filter, trace)
+        print(f"{name:20s} | {noise:10.3f} | {raw_noise / noise:8.2f}x | "
+              f"{step_latency(make_filter):13d}")
+
+
+if __name__ == "__main__":
+    main()
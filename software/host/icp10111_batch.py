@@ -0,0 +1,96 @@
+"""
+ICP-10111 Batch Conversion - Host Python
+========================================
+
+Converts recorded raw ICP-10111 words to temperature, pressure and
+altitude in bulk. Uses NumPy when it is installed and falls back to the
+scalar driver math (icp10111_calibration.Calibration) otherwise, so both
+paths produce the same numbers as the board.
+
+    from icp10111_batch import convert_batch, altitude_batch
+    temperature_c, pressure_pa = convert_batch(otp, raw_t, raw_p)
+    altitude_m = altitude_batch(pressure_pa, reference_pressure=101325)
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import _mp_path  # noqa: F401
+from icp10111_calibration import (
+    Calibration, P_PA_CALIB, LUT_LOWER, LUT_UPPER, QUADR_FACTOR,
+    OFFST_FACTOR, TEMP_OFFSET, TEMP_SCALE,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Barometric formula constants (same as ICP10111.calculate_altitude)
+ALTITUDE_SCALE = 44330.0
+ALTITUDE_EXPONENT = 0.1903
+SEA_LEVEL_PA = 101325.0
+
+
+def _convert_numpy(otp, raw_t, raw_p):
+    """Vectorized version of Calibration.convert"""
+    c0, c1, c2, c3 = otp
+    raw_t = np.asarray(raw_t, dtype=np.float64)
+    raw_p = np.asarray(raw_p, dtype=np.float64)
+
+    t = raw_t - 32768.0
+    tt = t * t
+    s1 = LUT_LOWER + (c0 * QUADR_FACTOR) * tt
+    s2 = OFFST_FACTOR * c3 + (c1 * QUADR_FACTOR) * tt
+    s3 = LUT_UPPER + (c2 * QUADR_FACTOR) * tt
+
+    p0, p1, p2 = P_PA_CALIB
+    d01 = p0 - p1
+    d12 = p1 - p2
+    d20 = p2 - p0
+    c = (s1 * s2 * d01 + s2 * s3 * d12 + s3 * s1 * d20) / (s3 * d01 + s1 * d12 + s2 * d20)
+    a = (p0 * s1 - p1 * s2 + d01 * c) / (s1 - s2)
+    b = (p0 - a) * (s1 + c)
+
+    temperature = TEMP_OFFSET + TEMP_SCALE * raw_t
+    pressure = a + b / (c + raw_p)
+    return temperature, pressure
+
+
+def _convert_python(otp, raw_t, raw_p):
+    """Pure-Python fallback using the driver's scalar conversion"""
+    calibration = Calibration(otp)
+    temperature = []
+    pressure = []
+    for t, p in zip(raw_t, raw_p):
+        temp_c, press_pa = calibration.convert(int(t), int(p))
+        temperature.append(temp_c)
+        pressure.append(press_pa)
+    return temperature, pressure
+
+
+def convert_batch(otp, raw_t, raw_p, use_numpy=True):
+    """Convert raw word sequences to (temperature °C, pressure Pa)
+
+    Returns NumPy arrays when NumPy is available and use_numpy is true,
+    otherwise lists.
+    """
+    if use_numpy and np is not None:
+        return _convert_numpy(otp, raw_t, raw_p)
+    return _convert_python(otp, raw_t, raw_p)
+
+
+def altitude_batch(pressure, reference_pressure=SEA_LEVEL_PA, use_numpy=True):
+    """Altitude in meters for a sequence of pressures in Pa"""
+    if use_numpy and np is not None:
+        ratio = np.asarray(pressure, dtype=np.float64) / reference_pressure
+        return ALTITUDE_SCALE * (1.0 - np.power(ratio, ALTITUDE_EXPONENT))
+    return [ALTITUDE_SCALE * (1 - pow(p / reference_pressure, ALTITUDE_EXPONENT))
+            for p in pressure]
+
+
+def process_batch(otp, raw_t, raw_p, reference_pressure=SEA_LEVEL_PA, use_numpy=True):
+    """Convert raw words to (temperature °C, pressure Pa, altitude m)"""
+    temperature, pressure = convert_batch(otp, raw_t, raw_p, use_numpy)
+    altitude = altitude_batch(pressure, reference_pressure, use_numpy)
+    return temperature, pressure, altitude
@@ -0,0 +1,90 @@
+"""
+ICP-10111 Binary Log Reader - Host Python
+=========================================
+
+Reads files written by examples/mp/icp10111_log.py. With NumPy the
+records are memory-mapped as a structured array, so columns are views
+into the file and nothing is copied:
+
+    from icp10111_logreader import read_log
+    otp, records = read_log('icp10111.log')
+    records['pressure'].mean()
+
+    python3 icp10111_logreader.py icp10111.log   # summary
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import os
+import struct
+import sys
+
+import _mp_path  # noqa: F401
+from icp10111_log import HEADER_SIZE, RECORD_FORMAT, RECORD_SIZE, unpack_header
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Structured dtype matching RECORD_FORMAT ('<IIHxxff')
+RECORD_FIELDS = ('timestamp', 'raw_p', 'raw_t', 'temperature', 'pressure')
+if np is not None:
+    RECORD_DTYPE = np.dtype({
+        'names': list(RECORD_FIELDS),
+        'formats': ['<u4', '<u4', '<u2', '<f4', '<f4'],
+        'offsets': [0, 4, 8, 12, 16],
+        'itemsize': RECORD_SIZE,
+    })
+
+
+def read_header(path):
+    """OTP calibration constants stored in a log file"""
+    with open(path, 'rb') as f:
+        return unpack_header(f.read(HEADER_SIZE))
+
+
+def read_log(path):
+    """Return (otp, records) with records as a read-only NumPy memmap
+
+    A partial record at the end (power lost mid-write) is ignored, as in
+    iter_records().
+    """
+    if np is None:
+        raise ImportError("read_log needs NumPy, use iter_records instead")
+    otp = read_header(path)
+    count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_SIZE
+    if count <= 0:
+        # mmap cannot map zero bytes
+        return otp, np.empty(0, dtype=RECORD_DTYPE)
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE,
+                        shape=(count,))
+    return otp, records
+
+
+def iter_records(path):
+    """Yield record tuples without NumPy (fields as in RECORD_FIELDS)"""
+    with open(path, 'rb') as f:
+        unpack_header(f.read(HEADER_SIZE))
+        while True:
+            block = f.read(RECORD_SIZE * 4096)
+            usable = len(block) - len(block) % RECORD_SIZE
+            if not usable:
+                break
+            yield from struct.iter_unpack(RECORD_FORMAT, block[:usable])
+
+
+def main():
+    for path in sys.argv[1:]:
+        otp, records = read_log(path)
+        print(f"{path}: {len(records)} records, OTP {otp}")
+        if len(records):
+            pressure = records['pressure']
+            print(f"  pressure    {pressure.min():.1f} .. {pressure.max():.1f} Pa")
+            print(f"  temperature {records['temperature'].min():.2f} .. "
+                  f"{records['temperature'].max():.2f} °C")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+ICP-10111 Fleet Log Replay - Host Python
+========================================
+
+Reprocesses binary logs (examples/mp/icp10111_log.py) from many nodes
+with the current driver math. The raw words of every record are
+re-converted with ICP10111.convert and ICP10111.calculate_altitude,
+using a driver instance built from the OTP constants in the log header
+(no bus access), so the results always match the firmware.
+
+Each file streams through a generator pipeline
+
+    parse -> convert -> filter -> aggregate
+
+that holds one read block (4096 records) at a time, so worker memory
+does not depend on file size. Files are fanned out across a process
+pool and the per-file statistics are merged per node in the parent.
+
+    python3 icp10111_replay.py logs/                 # every *.log below logs/
+    python3 icp10111_replay.py -j 8 --node-by-dir logs/*/*.log
+    python3 icp10111_replay.py --json logs/ > summary.json
+
+The node name is the file name without extension, or the parent
+directory name with --node-by-dir (one directory per node). A file that
+cannot be read (not a log, I/O error) is reported and left out; the
+other files are still aggregated.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+import _mp_path  # noqa: F401
+from icp10111 import ICP10111
+from icp10111_logreader import iter_records, read_header
+
+# Sensor operating range; anything outside is a corrupt or glitched record
+PRESSURE_RANGE_PA = (30000.0, 110000.0)
+TEMPERATURE_RANGE_C = (-40.0, 85.0)
+
+
+class RunningStats:
+    """Count, mean, variance, minimum and maximum in constant memory"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """Fold in statistics collected elsewhere (parallel Welford update)"""
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def std(self):
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class NodeSummary:
+    """Aggregated results of one or more log files of a node"""
+
+    def __init__(self, node):
+        self.node = node
+        self.files = 0
+        self.rejected = 0
+        self.first_ms = None
+        self.last_ms = None
+        self.temperature = RunningStats()
+        self.pressure = RunningStats()
+        self.altitude = RunningStats()
+
+    def add(self, timestamp, temperature, pressure, altitude):
+        if self.first_ms is None or timestamp < self.first_ms:
+            self.first_ms = timestamp
+        if self.last_ms is None or timestamp > self.last_ms:
+            self.last_ms = timestamp
+        self.temperature.add(temperature)
+        self.pressure.add(pressure)
+        self.altitude.add(altitude)
+
+    def merge(self, other):
+        self.files += other.files
+        self.rejected += other.rejected
+        for ts in (other.first_ms, other.last_ms):
+            if ts is not None:
+                if self.first_ms is None or ts < self.first_ms:
+                    self.first_ms = ts
+                if self.last_ms is None or ts > self.last_ms:
+                    self.last_ms = ts
+        self.temperature.merge(other.temperature)
+        self.pressure.merge(other.pressure)
+        self.altitude.merge(other.altitude)
+
+    @property
+    def samples(self):
+        return self.pressure.count
+
+    def as_dict(self):
+        def stats(s):
+            # No accepted samples: no statistics (and no ±inf in the JSON)
+            if not s.count:
+                return {'min': None, 'mean': None, 'max': None, 'std': None}
+            return {'min': s.min, 'mean': s.mean, 'max': s.max, 'std': s.std}
+
+        return {
+            'node': self.node,
+            'files': self.files,
+            'samples': self.samples,
+            'rejected': self.rejected,
+            'first_ms': self.first_ms,
+            'last_ms': self.last_ms,
+            'temperature_c': stats(self.temperature),
+            'pressure_pa': stats(self.pressure),
+            'altitude_m': stats(self.altitude),
+        }
+
+
+def parse(path):
+    """Yield (timestamp ms, raw_t, raw_p) from a log file"""
+    for timestamp, raw_p, raw_t, _, _ in iter_records(path):
+        yield timestamp, raw_t, raw_p
+
+
+def convert(records, sensor, reference_pressure):
+    """Yield (timestamp, °C, Pa, altitude m) using the driver math"""
+    for timestamp, raw_t, raw_p in records:
+        temperature, pressure = sensor.convert(raw_t, raw_p)
+        altitude = sensor.calculate_altitude(pressure, reference_pressure)
+        yield timestamp, temperature, pressure, altitude
+
+
+def in_range(samples, summary):
+    """Drop samples outside the sensor's range, counting them in summary"""
+    p_low, p_high = PRESSURE_RANGE_PA
+    t_low, t_high = TEMPERATURE_RANGE_C
+    for sample in samples:
+        if p_low <= sample[2] <= p_high and t_low <= sample[1] <= t_high:
+            yield sample
+        else:
+            summary.rejected += 1
+
+
+def aggregate(samples, summary):
+    for sample in samples:
+        summary.add(*sample)
+    return summary
+
+
+def node_name(path, by_dir=False):
+    if by_dir:
+        return os.path.basename(os.path.dirname(os.path.abspath(path)))
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def replay_file(job):
+    """Run the pipeline over one file (executed in a worker process)
+
+    Returns (summary, None), or (None, (path, error message)) when the file
+    cannot be replayed, so one bad file does not stop the pool.
+    """
+    path, node, reference_pressure = job
+    try:
+        # With the OTP constants given the driver never touches the bus
+        sensor = ICP10111(None, otp=read_header(path))
+        summary = NodeSummary(node)
+        summary.files = 1
+        records = parse(path)
+        samples = in_range(convert(records, sensor, reference_pressure), summary)
+        return aggregate(samples, summary), None
+    except Exception as e:
+        return None, (path, f"{type(e).__name__}: {e}")
+
+
+def find_logs(paths):
+    """Expand directories into the *.log files below them"""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith('.log'):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def replay(paths, jobs=None, reference_pressure=101325.0, by_dir=False):
+    """Replay log files; returns ({node: NodeSummary}, [(path, error)])"""
+    work = [(path, node_name(path, by_dir), reference_pressure)
+            for path in find_logs(paths)]
+    nodes = {}
+    failed = []
+
+    def collect(results):
+        for summary, error in results:
+            if error is not None:
+                failed.append(error)
+                continue
+            node = nodes.get(summary.node)
+            if node is None:
+                nodes[summary.node] = summary
+            else:
+                node.merge(summary)
+
+    if jobs == 1 or len(work) < 2:
+        collect(map(replay_file, work))
+    else:
+        # Largest files first so one big file does not finish last alone
+        work.sort(key=lambda job: os.path.getsize(job[0]), reverse=True)
+        with Pool(jobs) as pool:
+            collect(pool.imap_unordered(replay_file, work))
+    failed.sort()
+    return nodes, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay ICP-10111 fleet logs")
+    parser.add_argument('paths', nargs='+', help="log files or directories")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument('--reference', type=float, default=101325.0,
+                        help="reference pressure for altitude in Pa")
+    parser.add_argument('--node-by-dir', action='store_true',
+                        help="name nodes after the directory holding their logs")
+    parser.add_argument('--json', action='store_true', help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    nodes, failed = replay(args.paths, args.jobs, args.reference, args.node_by_dir)
+    elapsed = time.perf_counter() - start
+
+    total = sum(node.samples + node.rejected for node in nodes.values())
+    rate = total / elapsed if elapsed > 0 else 0.0
+    summaries = [nodes[name] for name in sorted(nodes)]
+
+    if args.json:
+        json.dump({
+            'nodes': [node.as_dict() for node in summaries],
+            'records': total,
+            'seconds': elapsed,
+            'samples_per_s': rate,
+            'failed': [{'path': path, 'error': error} for path, error in failed],
+        }, sys.stdout, indent=2, allow_nan=False)
+        print()
+        return
+
+    print(f"{'Node':16s} | Files | Samples | Rej | Temp °C mean | "
+          f"Pressure Pa min / mean / max (std) | Alt m min / max")
+    for node in summaries:
+        t, p, a = node.temperature, node.pressure, node.altitude
+        if not node.samples:
+            print(f"{node.node:16s} | {node.files:5d} | {0:7d} | "
+                  f"{node.rejected:3d} | {'n/a':>12s} | {'n/a':>38s} | {'n/a':>17s}")
+            continue
+        print(f"{node.node:16s} | {node.files:5d} | {node.samples:7d} | "
+              f"{node.rejected:3d} | {t.mean:12.2f} | "
+              f"{p.min:8.1f} / {p.mean:8.1f} / {p.max:8.1f} ({p.std:5.1f}) | "
+              f"{a.min:7.1f} / {a.max:7.1f}")
+    print(f"\n{len(nodes)} nodes, {total} records in {elapsed:.2f} s "
+          f"({rate:,.0f} samples/s)")
+    if failed:
+        print(f"\n{len(failed)} files failed:")
+        for path, error in failed:
+            print(f"  {path}: {error}")
+
+
+if __name__ == "__main__":
+    main()
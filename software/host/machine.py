@@ -0,0 +1,116 @@
+"""
+CPython shim for the MicroPython machine module
+===============================================
+
+Lets the scripts in examples/mp run unchanged on a desktop. I2C buses
+talk to the simulated devices from fakebus; by default every bus has a
+simulated ICP-10111 at 0x63 (with datasheet conversion delays and
+noise). Put this folder first on the import path:
+
+    PYTHONPATH=software/host python3 software/examples/mp/icp10111_basic.py
+
+Scripts can reach the simulated devices through machine.SIM_DEVICES
+(shared by all buses) to change conditions while running.
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import threading
+
+import _mp_path  # noqa: F401
+from fakebus import FakeI2C, FakeICP10111
+
+# Devices on every simulated bus, keyed by address
+SIM_DEVICES = {0x63: FakeICP10111(noise=True)}
+
+
+class Pin:
+    """GPIO stub; only remembers its configuration"""
+
+    IN = 0
+    OUT = 1
+    PULL_UP = 2
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self.mode = mode
+        self.pull = pull
+        self._value = value or 0
+
+    def value(self, value=None):
+        if value is None:
+            return self._value
+        self._value = value
+
+    def on(self):
+        self._value = 1
+
+    def off(self):
+        self._value = 0
+
+
+class I2C(FakeI2C):
+    """machine.I2C backed by the devices in SIM_DEVICES"""
+
+    def __init__(self, id=0, scl=None, sda=None, freq=400000):
+        super().__init__()
+        self.devices = SIM_DEVICES
+        self.id = id
+        self.freq = freq
+
+
+class SoftI2C(I2C):
+    pass
+
+
+class Timer:
+    """Periodic/one-shot timer running its callback on a thread"""
+
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, **kwargs):
+        self.id = id
+        self._thread = None
+        self._stop = threading.Event()
+        if kwargs:
+            self.init(**kwargs)
+
+    def init(self, mode=PERIODIC, period=-1, freq=None, callback=None):
+        self.deinit()
+        if freq is not None:
+            period = 1000 / freq
+        interval = period / 1000
+        self._stop = threading.Event()
+
+        def run():
+            while not self._stop.wait(interval):
+                callback(self)
+                if mode == Timer.ONE_SHOT:
+                    break
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+
+    def deinit(self):
+        self._stop.set()
+
+
+class RTC:
+    """Real-time clock stub with persistent user memory"""
+
+    _memory = b''
+
+    def memory(self, data=None):
+        if data is None:
+            return RTC._memory
+        RTC._memory = bytes(data)
+
+
+def reset():
+    raise SystemExit("machine.reset()")
+
+
+def deepsleep(time_ms=0):
+    raise SystemExit("machine.deepsleep()")
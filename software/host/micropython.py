@@ -0,0 +1,29 @@
+"""
+CPython shim for the MicroPython micropython module
+===================================================
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import threading
+
+_schedule_lock = threading.Lock()
+
+
+def const(value):
+    return value
+
+
+def native(func):
+    return func
+
+
+def viper(func):
+    return func
+
+
+def schedule(func, arg):
+    """Run func(arg) now, one scheduled call at a time"""
+    with _schedule_lock:
+        func(arg)
@@ -0,0 +1,62 @@
+"""
+ICP-10111 Sensor Array Tests
+============================
+
+Runs SensorArray against a simulated TCA9548A with one ICP-10111 per
+channel, all at address 0x63 and each at its own temperature and
+pressure: every channel must return its own reading and the mux must be
+left with no channel selected.
+
+    python3 -m pytest software/host
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import pytest
+
+import _mp_path  # noqa: F401
+from fakebus import FakeI2C, FakeICP10111, FakeTCA9548A
+from icp10111 import ICP10111
+from icp10111_array import SensorArray, TCA9548A
+
+# channel: (°C, Pa)
+CONDITIONS = {
+    0: (20.0, 101000.0),
+    2: (25.0, 95000.0),
+    5: (30.0, 90000.0),
+}
+
+
+def make_array():
+    fake_mux = FakeTCA9548A()
+    for channel, (temperature, pressure) in CONDITIONS.items():
+        fake_mux.add_device(channel, ICP10111.ADDRESS,
+                            FakeICP10111(temperature=temperature, pressure=pressure))
+    i2c = FakeI2C({TCA9548A.ADDRESS: fake_mux})
+    mux = TCA9548A(i2c)
+    array = SensorArray(i2c, mux, CONDITIONS, mode=ICP10111.MODE_LOW_POWER)
+    return fake_mux, mux, array
+
+
+def test_each_channel_returns_its_own_reading():
+    fake_mux, _, array = make_array()
+    for _ in range(2):
+        values = array.read_all()
+        for i, (temperature, pressure) in enumerate(CONDITIONS.values()):
+            assert values[2 * i] == pytest.approx(temperature, abs=0.01)
+            assert values[2 * i + 1] == pytest.approx(pressure / 100.0, abs=0.01)
+    for channel in CONDITIONS:
+        assert fake_mux.channels[channel][ICP10111.ADDRESS].measurements == 2
+
+
+def test_mux_is_deselected_after_each_phase():
+    fake_mux, mux, array = make_array()
+    assert fake_mux.mask == 0 and mux.channel is None
+
+    array.start_all()
+    assert fake_mux.mask == 0 and mux.channel is None
+
+    array.collect_all()
+    assert fake_mux.mask == 0 and mux.channel is None
+    assert all(stats.count == 1 for stats in array.stats)
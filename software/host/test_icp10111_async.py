@@ -0,0 +1,84 @@
+"""
+ICP-10111 Async Driver Tests
+============================
+
+Runs AsyncICP10111 under CPython asyncio on the fake bus: two sensors at
+different pressures sharing one bus, concurrent reads of the same sensor
+and reuse of the locks across separate asyncio.run() calls.
+
+    python3 -m pytest software/host
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import asyncio
+
+import pytest
+
+import _mp_path  # noqa: F401
+from fakebus import FakeI2C, FakeICP10111
+from icp10111 import ICP10111
+from icp10111_async import AsyncICP10111, bus_lock
+
+SECOND_ADDRESS = 0x64
+
+
+def make_pair():
+    i2c = FakeI2C({
+        ICP10111.ADDRESS: FakeICP10111(temperature=21.0, pressure=100000.0),
+        SECOND_ADDRESS: FakeICP10111(temperature=30.0, pressure=90000.0),
+    })
+    a = AsyncICP10111(i2c, mode=ICP10111.MODE_LOW_POWER)
+    b = AsyncICP10111(i2c, SECOND_ADDRESS, mode=ICP10111.MODE_LOW_POWER)
+    return i2c, a, b
+
+
+def assert_reading(reading, temperature, pressure_hpa):
+    assert reading[0] == pytest.approx(temperature, abs=0.01)
+    assert reading[1] == pytest.approx(pressure_hpa, abs=0.01)
+
+
+def test_two_sensors_return_their_own_readings():
+    _, a, b = make_pair()
+
+    async def run():
+        return await asyncio.gather(a.read(), b.read())
+
+    first, second = asyncio.run(run())
+    assert_reading(first, 21.0, 1000.0)
+    assert_reading(second, 30.0, 900.0)
+
+
+def test_concurrent_reads_of_one_sensor():
+    i2c, a, b = make_pair()
+
+    async def run():
+        return await asyncio.gather(a.read(), b.read(), a.read(), b.read(),
+                                    a.read())
+
+    readings = asyncio.run(run())
+    for reading in readings[0::2]:
+        assert_reading(reading, 21.0, 1000.0)
+    for reading in readings[1::2]:
+        assert_reading(reading, 30.0, 900.0)
+    # One measurement command per read, none restarted or lost
+    assert i2c.devices[ICP10111.ADDRESS].measurements == 3
+    assert i2c.devices[SECOND_ADDRESS].measurements == 2
+
+
+def test_locks_follow_the_event_loop():
+    i2c, a, _ = make_pair()
+
+    async def lock_and_read():
+        await a.read()
+        return bus_lock(i2c)
+
+    first = asyncio.run(lock_and_read())
+    second = asyncio.run(lock_and_read())
+    assert first is not second
+
+    async def same_loop():
+        return bus_lock(i2c) is a.lock
+
+    assert asyncio.run(same_loop())
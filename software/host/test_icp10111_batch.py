@@ -0,0 +1,104 @@
+"""
+ICP-10111 Batch Conversion Tests
+================================
+
+Checks that both icp10111_batch paths (NumPy and pure Python) match the
+scalar Calibration.convert and a full ICP10111 read on the fake bus, over
+a grid of raw words including the ends of the 16-bit temperature range
+and the LUT_LOWER / LUT_UPPER pressure points.
+
+    python3 -m pytest software/host
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import pytest
+
+import _mp_path  # noqa: F401
+import icp10111_batch as batch
+from fakebus import DEFAULT_OTP, FakeI2C, FakeICP10111
+from icp10111 import ICP10111
+from icp10111_calibration import Calibration, LUT_LOWER, LUT_UPPER
+
+OTP_SETS = [
+    DEFAULT_OTP,
+    (-1910, 2200, -1750, 3800),
+    (0, 0, 0, 0),
+    (32767, -32768, 32767, -32768),
+]
+
+RAW_T = [0, 1, 16384, 32767, 32768, 32769, 49152, 0xFFFE, 0xFFFF]
+RAW_P = [int(LUT_LOWER) - 1, int(LUT_LOWER), int(LUT_LOWER) + 1, 0x600000,
+         0x800000, int(LUT_UPPER) - 1, int(LUT_UPPER), int(LUT_UPPER) + 1,
+         0xFFFFFF]
+
+REL = 1e-9
+
+
+def grid():
+    raw_t = [t for t in RAW_T for _ in RAW_P]
+    raw_p = [p for _ in RAW_T for p in RAW_P]
+    return raw_t, raw_p
+
+
+def scalar(otp, raw_t, raw_p):
+    calibration = Calibration(otp)
+    results = [calibration.convert(t, p) for t, p in zip(raw_t, raw_p)]
+    return [r[0] for r in results], [r[1] for r in results]
+
+
+def driver(otp, raw_t, raw_p):
+    """Conversion through ICP10111.read_sensor_data on the fake bus"""
+    device = FakeICP10111(otp=otp, timing=False)
+    sensor = ICP10111(FakeI2C({ICP10111.ADDRESS: device}))
+    temperature = []
+    pressure = []
+    for t, p in zip(raw_t, raw_p):
+        device.raw_t, device.raw_p = t, p
+        temp_c, press_hpa = sensor.read_sensor_data()
+        temperature.append(temp_c)
+        pressure.append(press_hpa * 100.0)
+    return temperature, pressure
+
+
+def assert_close(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert float(a) == pytest.approx(e, rel=REL, abs=1e-9)
+
+
+@pytest.mark.parametrize("otp", OTP_SETS)
+def test_driver_matches_calibration(otp):
+    raw_t, raw_p = grid()
+    temperature, pressure = scalar(otp, raw_t, raw_p)
+    driver_t, driver_p = driver(otp, raw_t, raw_p)
+    assert_close(driver_t, temperature)
+    assert_close(driver_p, pressure)
+
+
+@pytest.mark.parametrize("otp", OTP_SETS)
+def test_python_path_matches_scalar(otp):
+    raw_t, raw_p = grid()
+    temperature, pressure = scalar(otp, raw_t, raw_p)
+    batch_t, batch_p = batch._convert_python(otp, raw_t, raw_p)
+    assert_close(batch_t, temperature)
+    assert_close(batch_p, pressure)
+
+
+@pytest.mark.skipif(batch.np is None, reason="NumPy is not installed")
+@pytest.mark.parametrize("otp", OTP_SETS)
+def test_numpy_path_matches_scalar(otp):
+    raw_t, raw_p = grid()
+    temperature, pressure = scalar(otp, raw_t, raw_p)
+    batch_t, batch_p = batch._convert_numpy(otp, raw_t, raw_p)
+    assert_close(batch_t, temperature)
+    assert_close(batch_p, pressure)
+
+
+def test_convert_batch_selects_path():
+    raw_t, raw_p = grid()
+    temperature, pressure = batch.convert_batch(DEFAULT_OTP, raw_t, raw_p,
+                                                use_numpy=False)
+    assert isinstance(pressure, list)
+    assert_close(pressure, scalar(DEFAULT_OTP, raw_t, raw_p)[1])
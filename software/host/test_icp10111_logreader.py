@@ -0,0 +1,77 @@
+"""
+ICP-10111 Log Reader Tests
+==========================
+
+Reads files written by BinaryLogger with read_log() (NumPy memmap) and
+iter_records(), including a file cut off in the middle of a record as
+left by a logger that lost power while writing.
+
+    python3 -m pytest software/host
+
+Author: UNIT Electronics
+License: MIT
+"""
+
+import pytest
+
+import _mp_path  # noqa: F401
+import icp10111_logreader as logreader
+from fakebus import DEFAULT_OTP
+from icp10111_log import BinaryLogger, HEADER_SIZE, RECORD_SIZE
+
+RECORDS = 10
+
+needs_numpy = pytest.mark.skipif(logreader.np is None,
+                                 reason="NumPy is not installed")
+
+
+def write_log(path, records=RECORDS):
+    logger = BinaryLogger(str(path), DEFAULT_OTP, block_records=4)
+    for i in range(records):
+        logger.log(i * 1000, 30000 + i, 8000000 + i, 20.0 + i, 100000.0 + i)
+    logger.close()
+    return path
+
+
+def truncate(path, extra_bytes):
+    """Keep the complete records plus extra_bytes of the next one"""
+    data = path.read_bytes()
+    path.write_bytes(data + data[HEADER_SIZE:HEADER_SIZE + extra_bytes])
+
+
+def test_iter_records_skips_partial_record(tmp_path):
+    path = write_log(tmp_path / "node.log")
+    truncate(path, RECORD_SIZE // 2)
+    records = list(logreader.iter_records(str(path)))
+    assert len(records) == RECORDS
+    assert records[-1][0] == (RECORDS - 1) * 1000
+
+
+@needs_numpy
+def test_read_log_complete_file(tmp_path):
+    path = write_log(tmp_path / "node.log")
+    otp, records = logreader.read_log(str(path))
+    assert otp == DEFAULT_OTP
+    assert len(records) == RECORDS
+    assert records['raw_t'][3] == 30003
+    assert records['pressure'][-1] == pytest.approx(100000.0 + RECORDS - 1)
+
+
+@needs_numpy
+def test_read_log_truncated_file(tmp_path):
+    path = write_log(tmp_path / "node.log")
+    truncate(path, RECORD_SIZE - 1)
+    otp, records = logreader.read_log(str(path))
+    assert otp == DEFAULT_OTP
+    assert len(records) == RECORDS
+    assert list(records['timestamp']) == [i * 1000 for i in range(RECORDS)]
+
+
+@needs_numpy
+def test_read_log_header_only(tmp_path):
+    path = write_log(tmp_path / "node.log", records=0)
+    # Header plus the first bytes of a record that never completed
+    path.write_bytes(path.read_bytes() + bytes(5))
+    otp, records = logreader.read_log(str(path))
+    assert otp == DEFAULT_OTP
+    assert len(records) == 0